@@ -5,6 +5,7 @@ FastAPI example with HyreLog integration
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from hyrelog import HyreLogWorkspaceClient, EventInput
+from hyrelog.adapters import HyreLogMiddleware
 from pydantic import BaseModel
 import os
 from typing import Optional
@@ -27,6 +28,9 @@ client = HyreLogWorkspaceClient(
     debug=True,
 )
 
+# Log every request through the background batcher (no HyreLog I/O on the request path)
+app.add_middleware(HyreLogMiddleware, client=client, exclude_paths=["/health"])
+
 
 class UserCreate(BaseModel):
     name: str
@@ -38,40 +42,6 @@ class UserUpdate(BaseModel):
     email: Optional[str] = None
 
 
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """Middleware to log all requests"""
-    import time
-
-    start_time = time.time()
-
-    # Process request
-    response = await call_next(request)
-
-    # Calculate duration
-    duration_ms = (time.time() - start_time) * 1000
-
-    # Log event
-    await client.log_event(
-        EventInput(
-            action=f"http.{request.method.lower()}",
-            category="http",
-            payload={
-                "method": request.method,
-                "path": str(request.url.path),
-                "status_code": response.status_code,
-                "duration_ms": duration_ms,
-            },
-            metadata={
-                "user_agent": request.headers.get("user-agent"),
-                "ip": request.client.host if request.client else None,
-            },
-        )
-    )
-
-    return response
-
-
 @app.get("/api/users")
 async def get_users(request: Request):
     """Get all users"""
@@ -0,0 +1,80 @@
+"""
+Cold import cost of the SDK, checked against a budget
+
+Each scenario runs in a fresh interpreter and is measured with
+``python -X importtime``; the median of several runs is compared with its
+budget and the script exits non-zero when any budget is exceeded. The last
+scenario also fails if queuing an event with tracing off loads httpx or
+OpenTelemetry.
+
+Usage:
+    python benchmarks/import_time.py [runs]
+"""
+
+import os
+import re
+import statistics
+import subprocess
+import sys
+from typing import List, Tuple
+
+# (description, code, budget in milliseconds)
+SCENARIOS: List[Tuple[str, str, float]] = [
+    ("import hyrelog", "import hyrelog", 5.0),
+    (
+        "workspace client + enqueue (tracing off)",
+        "import asyncio, sys\n"
+        "from hyrelog import HyreLogWorkspaceClient, EventInput\n"
+        "async def main():\n"
+        "    client = HyreLogWorkspaceClient('key', tracing='off')\n"
+        "    client.enqueue_event(EventInput(action='a', category='b'))\n"
+        "    heavy = [m for m in sys.modules if m.startswith(('httpx', 'opentelemetry'))]\n"
+        "    assert not heavy, heavy\n"
+        "asyncio.run(main())\n",
+        250.0,
+    ),
+]
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \| (\S.*)$")
+
+
+def _measure(code: str) -> float:
+    """Total microseconds spent importing hyrelog modules, in milliseconds"""
+    env = dict(os.environ)
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (package_root, env.get("PYTHONPATH")) if p)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    total_us = 0
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        # Top-level hyrelog entries carry the cumulative time of everything
+        # the SDK pulled in, including modules loaded lazily on attribute access
+        if match and match.group(2).startswith("hyrelog"):
+            total_us += int(match.group(1))
+    return total_us / 1000
+
+
+def main() -> int:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    failed = False
+    for description, code, budget in SCENARIOS:
+        try:
+            median = statistics.median(_measure(code) for _ in range(runs))
+        except subprocess.CalledProcessError as e:
+            print(f"  FAIL {description}: {e.stderr.strip().splitlines()[-1]}")
+            failed = True
+            continue
+        status = "ok  " if median <= budget else "FAIL"
+        failed = failed or median > budget
+        print(f"  {status} {description}: {median:7.1f} ms (budget {budget:.0f} ms)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
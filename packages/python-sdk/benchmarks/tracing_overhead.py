@@ -0,0 +1,83 @@
+"""
+Per-event SDK overhead with tracing full, sampled and off
+
+Requests go to an in-memory transport, so the numbers are the SDK's own cost.
+When opentelemetry-sdk is installed a real TracerProvider with an in-memory
+exporter is configured; otherwise the API's no-op tracer is measured.
+
+Usage:
+    python benchmarks/tracing_overhead.py [events]
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import httpx
+
+# Run from a checkout without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hyrelog import EventInput, HyreLogWorkspaceClient  # noqa: E402
+
+
+def _install_tracer_provider() -> str:
+    try:
+        from opentelemetry import trace
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+    except ImportError:
+        return "opentelemetry-api (no-op tracer)"
+
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(InMemorySpanExporter()))
+    trace.set_tracer_provider(provider)
+    return "opentelemetry-sdk (in-memory exporter)"
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        201,
+        json={
+            "id": "evt",
+            "companyId": "company",
+            "workspaceId": "workspace",
+            "action": "bench.event",
+            "category": "bench",
+            "hash": "hash",
+            "createdAt": "2024-01-01T00:00:00Z",
+            "archived": False,
+        },
+    )
+
+
+async def _run(mode: str, events: int) -> float:
+    client = HyreLogWorkspaceClient(
+        workspace_key="bench",
+        base_url="http://hyrelog.invalid",
+        tracing=mode,
+        trace_sample_rate=0.01,
+    )
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    event = EventInput(action="bench.event", category="bench")
+
+    started = time.perf_counter()
+    for _ in range(events):
+        await client.log_event(event)
+    elapsed = time.perf_counter() - started
+
+    await client.close()
+    return elapsed / events * 1_000_000
+
+
+async def main() -> None:
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    print(f"tracer: {_install_tracer_provider()}, events: {events}")
+    for mode in ("off", "sampled", "full"):
+        print(f"  {mode:>8}: {await _run(mode, events):8.1f} us/event")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
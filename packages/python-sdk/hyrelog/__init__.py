@@ -2,18 +2,39 @@
 HyreLog Python SDK
 
 Official SDK for ingesting and querying audit events in HyreLog.
+
+Public names are loaded on first access (PEP 562), so ``import hyrelog``
+does not pull in httpx, pydantic or OpenTelemetry until they are needed.
 """
 
-from hyrelog.client.workspace import HyreLogWorkspaceClient
-from hyrelog.client.company import HyreLogCompanyClient
-from hyrelog.types import (
-    EventInput,
-    Event,
-    QueryOptions,
-    QueryResponse,
-    BatchOptions,
-    HyreLogClientOptions,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from hyrelog.client.workspace import HyreLogWorkspaceClient
+    from hyrelog.client.company import HyreLogCompanyClient
+    from hyrelog.types import (
+        EventInput,
+        Event,
+        QueryOptions,
+        QueryResponse,
+        BatchOptions,
+        HyreLogClientOptions,
+        ClientStats,
+    )
+
+# Public name -> module that defines it
+_LAZY_ATTRIBUTES = {
+    "HyreLogWorkspaceClient": "hyrelog.client.workspace",
+    "HyreLogCompanyClient": "hyrelog.client.company",
+    "EventInput": "hyrelog.types",
+    "Event": "hyrelog.types",
+    "QueryOptions": "hyrelog.types",
+    "QueryResponse": "hyrelog.types",
+    "BatchOptions": "hyrelog.types",
+    "HyreLogClientOptions": "hyrelog.types",
+    "ClientStats": "hyrelog.types",
+}
 
 __all__ = [
     "HyreLogWorkspaceClient",
@@ -24,7 +45,21 @@ __all__ = [
     "QueryResponse",
     "BatchOptions",
     "HyreLogClientOptions",
+    "ClientStats",
 ]
 
 __version__ = "1.0.0"
 
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module 'hyrelog' has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,174 @@
+"""
+Command line entry point: ``python -m hyrelog <command>``
+
+Commands:
+    collector   Run the local aggregator daemon (see ``hyrelog.collector``)
+    import      Bulk import an NDJSON or CSV file (see ``hyrelog.importer``)
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+from typing import List, Optional
+
+
+def _collector(args: argparse.Namespace) -> int:
+    from hyrelog.collector import Collector
+
+    if not args.workspace_key:
+        print(
+            "A workspace key is required (--workspace-key or HYRELOG_WORKSPACE_KEY)",
+            file=sys.stderr,
+        )
+        return 2
+
+    collector = Collector(
+        workspace_key=args.workspace_key,
+        socket_path=args.socket,
+        base_url=args.base_url,
+        spool_dir=args.spool_dir,
+        max_batch_size=args.batch_size,
+        max_wait=args.max_wait,
+        http_port=args.http_port,
+        shutdown_timeout=args.shutdown_timeout,
+    )
+    asyncio.run(collector.serve_forever())
+    return 0
+
+
+def _import(args: argparse.Namespace) -> int:
+    from hyrelog.client.workspace import HyreLogWorkspaceClient
+    from hyrelog.importer import BulkImporter
+
+    if not args.workspace_key:
+        print(
+            "A workspace key is required (--workspace-key or HYRELOG_WORKSPACE_KEY)",
+            file=sys.stderr,
+        )
+        return 2
+
+    async def run() -> bool:
+        client = HyreLogWorkspaceClient(
+            workspace_key=args.workspace_key,
+            base_url=args.base_url,
+            tracing="off",
+        )
+        try:
+            importer = BulkImporter(
+                client,
+                args.file,
+                format=args.format,
+                batch_size=args.batch_size,
+                chunk_bytes=args.chunk_mb * 1024 * 1024,
+                workers=args.workers,
+                concurrency=args.concurrency,
+                checkpoint=None if args.no_checkpoint else args.checkpoint or "",
+                rejects=args.rejects,
+                progress_interval=args.progress_interval,
+                resume=not args.restart,
+            )
+            result = await importer.run()
+        finally:
+            await client.close()
+        return result.events_invalid == 0 and result.events_rejected == 0
+
+    try:
+        clean = asyncio.run(run())
+    except (OSError, ValueError) as e:
+        print(f"Import failed: {e}", file=sys.stderr)
+        return 1
+    except Exception as e:
+        if args.debug:
+            logging.exception("Import failed")
+        print(f"Import failed: {e}\nRun the same command again to resume", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        print("Import interrupted; run the same command again to resume", file=sys.stderr)
+        return 130
+    # Exit status 3: imported, but some events were invalid or rejected
+    return 0 if clean else 3
+
+
+def _add_connection_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--workspace-key",
+        default=os.environ.get("HYRELOG_WORKSPACE_KEY"),
+        help="Workspace API key (default: $HYRELOG_WORKSPACE_KEY)",
+    )
+    parser.add_argument(
+        "--base-url",
+        default=os.environ.get("HYRELOG_BASE_URL", "https://api.hyrelog.com"),
+        help="API base URL (default: $HYRELOG_BASE_URL or https://api.hyrelog.com)",
+    )
+
+
+def _parser() -> argparse.ArgumentParser:
+    from hyrelog.collector import DEFAULT_SOCKET_PATH
+
+    parser = argparse.ArgumentParser(prog="python -m hyrelog", description="HyreLog SDK tools")
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    collector = commands.add_parser("collector", help="Run the local aggregator daemon")
+    _add_connection_arguments(collector)
+    collector.add_argument("--socket", default=DEFAULT_SOCKET_PATH, help="Unix socket path")
+    collector.add_argument("--spool-dir", help="Directory for undeliverable events")
+    collector.add_argument("--batch-size", type=int, default=100, help="Events per batch")
+    collector.add_argument(
+        "--max-wait", type=float, default=1.0, help="Seconds before a partial batch is sent"
+    )
+    collector.add_argument(
+        "--http-port", type=int, help="Serve GET /health and /metrics on 127.0.0.1:PORT"
+    )
+    collector.add_argument(
+        "--shutdown-timeout", type=float, default=10.0, help="Seconds allowed for the final drain"
+    )
+    collector.set_defaults(handler=_collector)
+
+    importer = commands.add_parser("import", help="Bulk import an NDJSON or CSV file")
+    importer.add_argument("file", help="NDJSON or CSV file, optionally gzipped")
+    _add_connection_arguments(importer)
+    importer.add_argument(
+        "--format", choices=["ndjson", "csv"], help="Input format (default: from the extension)"
+    )
+    importer.add_argument("--batch-size", type=int, default=100, help="Events per request")
+    importer.add_argument("--concurrency", type=int, default=8, help="Batch uploads in flight")
+    importer.add_argument("--workers", type=int, help="Parser processes (default: one per CPU)")
+    importer.add_argument(
+        "--chunk-mb", type=int, default=4, help="Megabytes of input per parse task"
+    )
+    importer.add_argument(
+        "--checkpoint", help="Checkpoint file for resuming (default: FILE.checkpoint)"
+    )
+    importer.add_argument(
+        "--no-checkpoint", action="store_true", help="Do not record progress for resuming"
+    )
+    importer.add_argument(
+        "--restart", action="store_true", help="Ignore an existing checkpoint and start over"
+    )
+    importer.add_argument(
+        "--rejects", help="Append invalid and rejected events to this NDJSON file"
+    )
+    importer.add_argument(
+        "--progress-interval", type=float, default=5.0, help="Seconds between progress reports"
+    )
+    importer.set_defaults(handler=_import)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.DEBUG if args.debug else logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    if not args.debug:
+        # httpx logs every request at INFO
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
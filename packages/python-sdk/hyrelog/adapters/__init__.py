@@ -0,0 +1,7 @@
+"""
+Framework adapters for HyreLog SDK
+"""
+
+from hyrelog.adapters.asgi import HyreLogMiddleware
+
+__all__ = ["HyreLogMiddleware"]
@@ -0,0 +1,186 @@
+"""
+ASGI middleware for HyreLog (FastAPI, Starlette and other ASGI frameworks)
+"""
+
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, MutableMapping, Optional
+
+from hyrelog.client.workspace import HyreLogWorkspaceClient
+from hyrelog.types import Actor, EventInput
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+
+class HyreLogMiddleware:
+    """
+    ASGI middleware for automatic request logging
+
+    Events are handed to the client's background batcher with
+    ``enqueue_event``, so no HyreLog network I/O is awaited on the request
+    path. ``get_actor`` and ``get_project_id`` receive the ASGI scope.
+
+    Example:
+        app.add_middleware(HyreLogMiddleware, client=client, exclude_paths=["/health"])
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        client: Optional[HyreLogWorkspaceClient] = None,
+        workspace_key: Optional[str] = None,
+        client_options: Optional[Dict[str, Any]] = None,
+        auto_log: bool = True,
+        log_errors: bool = True,
+        log_slow_requests: bool = True,
+        slow_request_threshold: float = 1000.0,
+        sample_rate: float = 1.0,
+        exclude_paths: Iterable[str] = (),
+        max_value_length: int = 1024,
+        get_actor: Optional[Callable[[Scope], Optional[Dict[str, Any]]]] = None,
+        get_project_id: Optional[Callable[[Scope], Optional[str]]] = None,
+    ):
+        if client is None and workspace_key is None:
+            raise ValueError("HyreLogMiddleware requires a client or a workspace_key")
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1")
+
+        self.app = app
+        self.owns_client = client is None
+        self.client = client or HyreLogWorkspaceClient(
+            workspace_key=workspace_key, **(client_options or {})
+        )
+        self.auto_log = auto_log
+        self.log_errors = log_errors
+        self.log_slow_requests = log_slow_requests
+        self.slow_request_threshold = slow_request_threshold
+        self.sample_rate = sample_rate
+        self.max_value_length = max_value_length
+        self.get_actor = get_actor
+        self.get_project_id = get_project_id
+
+        # Paths ending in "*" are prefixes, everything else must match exactly
+        paths = list(exclude_paths)
+        self._excluded_exact = frozenset(p for p in paths if not p.endswith("*"))
+        self._excluded_prefixes = tuple(p[:-1] for p in paths if p.endswith("*"))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan" and self.owns_client:
+            await self.app(scope, self._wrap_lifespan_receive(receive), send)
+            return
+
+        if scope["type"] != "http" or self._is_excluded(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            if self.log_errors:
+                self._enqueue(
+                    scope,
+                    "http.error",
+                    "error",
+                    {
+                        "method": scope["method"],
+                        "path": self._cap(scope["path"]),
+                        "error": self._cap(str(e)),
+                    },
+                )
+            raise
+
+        duration_ms = (time.perf_counter() - started) * 1000
+        if self.auto_log and (
+            self.sample_rate >= 1.0 or status_code >= 500 or random.random() < self.sample_rate
+        ):
+            self._enqueue(
+                scope,
+                f"http.{scope['method'].lower()}",
+                "http",
+                {
+                    "method": scope["method"],
+                    "path": self._cap(scope["path"]),
+                    "status_code": status_code,
+                    "duration_ms": duration_ms,
+                },
+                {
+                    "user_agent": self._cap(self._header(scope, b"user-agent")),
+                    "ip": scope["client"][0] if scope.get("client") else None,
+                },
+            )
+
+        if self.log_slow_requests and duration_ms > self.slow_request_threshold:
+            self._enqueue(
+                scope,
+                "http.slow_request",
+                "performance",
+                {
+                    "method": scope["method"],
+                    "path": self._cap(scope["path"]),
+                    "duration_ms": duration_ms,
+                },
+            )
+
+    def _enqueue(
+        self,
+        scope: Scope,
+        action: str,
+        category: str,
+        payload: Dict[str, Any],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Build an event and hand it to the background batcher"""
+        actor = self.get_actor(scope) if self.get_actor else None
+        project_id = self.get_project_id(scope) if self.get_project_id else None
+        self.client.enqueue_event(
+            EventInput(
+                action=action,
+                category=category,
+                actor=Actor(**actor) if actor else None,
+                payload=payload,
+                metadata=metadata,
+                project_id=project_id,
+            )
+        )
+
+    def _is_excluded(self, path: str) -> bool:
+        return path in self._excluded_exact or (
+            bool(self._excluded_prefixes) and path.startswith(self._excluded_prefixes)
+        )
+
+    def _cap(self, value: Optional[str]) -> Optional[str]:
+        """Truncate a string value to max_value_length"""
+        if value is None or len(value) <= self.max_value_length:
+            return value
+        return value[: self.max_value_length]
+
+    @staticmethod
+    def _header(scope: Scope, name: bytes) -> Optional[str]:
+        for key, value in scope.get("headers", ()):
+            if key == name:
+                return value.decode("latin-1")
+        return None
+
+    def _wrap_lifespan_receive(self, receive: Receive) -> Receive:
+        """Close the middleware-owned client when the server shuts down"""
+
+        async def receive_wrapper() -> Message:
+            message = await receive()
+            if message["type"] == "lifespan.shutdown":
+                await self.client.close()
+            return message
+
+        return receive_wrapper
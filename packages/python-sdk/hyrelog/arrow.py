@@ -0,0 +1,161 @@
+"""
+Columnar export of events to Apache Arrow and Parquet
+
+Requires the optional ``pyarrow`` dependency:
+
+    pip install "hyrelog-python[arrow]"
+"""
+
+import json
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional
+
+from hyrelog.compact import FIELD_NAMES, EventBatch
+from hyrelog.types import QueryOptions
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from hyrelog.client.base import BaseClient
+
+# Fields stored as JSON text
+JSON_FIELDS = ("payload", "metadata", "changes")
+
+
+def _pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            'Arrow export requires pyarrow: pip install "hyrelog-python[arrow]"'
+        ) from e
+    return pyarrow
+
+
+def event_schema() -> "pa.Schema":
+    """
+    Fixed Arrow schema for events
+
+    Actor and target are flattened into columns, payload/metadata/changes
+    are JSON-encoded strings, and low-cardinality strings are dictionary
+    encoded.
+    """
+    pa = _pyarrow()
+    label = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema(
+        [
+            pa.field("id", pa.string(), nullable=False),
+            pa.field("company_id", pa.string()),
+            pa.field("workspace_id", pa.string()),
+            pa.field("project_id", pa.string()),
+            pa.field("action", label),
+            pa.field("category", label),
+            pa.field("actor_id", pa.string()),
+            pa.field("actor_email", pa.string()),
+            pa.field("actor_name", pa.string()),
+            pa.field("target_id", pa.string()),
+            pa.field("target_type", pa.string()),
+            pa.field("payload", pa.string()),
+            pa.field("metadata", pa.string()),
+            pa.field("changes", pa.string()),
+            pa.field("hash", pa.string()),
+            pa.field("prev_hash", pa.string()),
+            pa.field("trace_id", pa.string()),
+            pa.field("span_id", pa.string()),
+            pa.field("created_at", pa.timestamp("ms", tz="UTC")),
+            pa.field("archived", pa.bool_()),
+            pa.field("data_region", label),
+        ]
+    )
+
+
+def _json_column(values: List[Any]) -> List[Optional[str]]:
+    return [None if value is None else json.dumps(value, separators=(",", ":")) for value in values]
+
+
+def batch_to_arrow(batch: EventBatch, schema: Optional["pa.Schema"] = None) -> "pa.RecordBatch":
+    """Convert an ``EventBatch`` to an Arrow record batch with ``event_schema()``"""
+    pa = _pyarrow()
+    schema = schema or event_schema()
+    arrays = []
+    for field in schema:
+        values = batch.column(field.name)
+        if field.name in JSON_FIELDS:
+            arrays.append(pa.array(_json_column(values), type=field.type))
+        elif field.name == "created_at":
+            arrays.append(pa.array(values, type=pa.string()).cast(field.type))
+        else:
+            arrays.append(pa.array(values, type=field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+async def stream_record_batches(
+    client: "BaseClient",
+    options: Optional[QueryOptions] = None,
+    source: str = "query",
+    batch_size: int = 10000,
+) -> AsyncIterator["pa.RecordBatch"]:
+    """
+    Stream matching events as Arrow record batches of ``batch_size`` rows
+
+    ``source`` is ``"query"`` (paginated query) or ``"export"`` (export
+    endpoint). Query pages are buffered until ``batch_size`` rows are
+    available, so each batch (and Parquet row group) is full size. Only one
+    batch is held in memory at a time.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    schema = event_schema()
+    pending: Dict[str, List[Any]] = {name: [] for name in FIELD_NAMES}
+    rows = 0
+    async for batch in client.iter_event_batches(options, source=source, batch_size=batch_size):
+        for name in FIELD_NAMES:
+            pending[name].extend(batch.column(name))
+        rows += len(batch)
+        while rows >= batch_size:
+            full = EventBatch({name: values[:batch_size] for name, values in pending.items()})
+            pending = {name: values[batch_size:] for name, values in pending.items()}
+            rows -= batch_size
+            yield batch_to_arrow(full, schema)
+    if rows:
+        yield batch_to_arrow(EventBatch(pending), schema)
+
+
+async def to_arrow_table(
+    client: "BaseClient",
+    options: Optional[QueryOptions] = None,
+    source: str = "query",
+    batch_size: int = 10000,
+) -> "pa.Table":
+    """Collect matching events into an Arrow table (use ``.to_pandas()`` for a DataFrame)"""
+    pa = _pyarrow()
+    batches = [
+        record_batch
+        async for record_batch in stream_record_batches(client, options, source, batch_size)
+    ]
+    return pa.Table.from_batches(batches, schema=event_schema())
+
+
+async def write_parquet(
+    client: "BaseClient",
+    path: str,
+    options: Optional[QueryOptions] = None,
+    source: str = "query",
+    batch_size: int = 10000,
+    compression: str = "zstd",
+) -> int:
+    """
+    Write matching events to a Parquet file incrementally
+
+    Each record batch is written as it arrives, so memory stays bounded by
+    the batch size. Returns the number of rows written.
+    """
+    _pyarrow()
+    import pyarrow.parquet as pq
+
+    schema = event_schema()
+    rows = 0
+    with pq.ParquetWriter(path, schema, compression=compression) as writer:
+        async for record_batch in stream_record_batches(client, options, source, batch_size):
+            writer.write_batch(record_batch)
+            rows += record_batch.num_rows
+    return rows
@@ -2,8 +2,25 @@
 Client implementations
 """
 
-from hyrelog.client.workspace import HyreLogWorkspaceClient
-from hyrelog.client.company import HyreLogCompanyClient
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from hyrelog.client.workspace import HyreLogWorkspaceClient
+    from hyrelog.client.company import HyreLogCompanyClient
+
+_LAZY_ATTRIBUTES = {
+    "HyreLogWorkspaceClient": "hyrelog.client.workspace",
+    "HyreLogCompanyClient": "hyrelog.client.company",
+}
 
 __all__ = ["HyreLogWorkspaceClient", "HyreLogCompanyClient"]
 
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module 'hyrelog.client' has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
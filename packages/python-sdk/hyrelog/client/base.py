@@ -3,40 +3,234 @@ Base client implementation with common functionality
 """
 
 import asyncio
+import json
 import logging
-from typing import Optional, Dict, Any, TypeVar, Generic
-import httpx
-from opentelemetry import trace
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Iterator,
+    Optional,
+    Dict,
+    Any,
+    TypeVar,
+    Generic,
+    Union,
+)
 
-from hyrelog.types import HyreLogClientOptions, RetryConfig
+from hyrelog import lifecycle
+from hyrelog.compact import CompactEvent, EventBatch
+from hyrelog.metrics import ClientMetrics
+from hyrelog.tracing import Tracing
+from hyrelog.types import ClientStats, Event, HyreLogClientOptions, QueryOptions, RetryConfig
+
+if TYPE_CHECKING:
+    import httpx
 
 T = TypeVar("T")
 
 logger = logging.getLogger("hyrelog")
 
+# Page size used by iterators when QueryOptions.limit is not set explicitly
+ITER_PAGE_SIZE = 500
+
+# QueryOptions fields accepted by the export endpoints
+EXPORT_FILTERS = {"from_date", "to_date", "action", "category"}
+
+# Absolute time.monotonic() deadline for requests made in the current context
+_deadline: ContextVar[Optional[float]] = ContextVar("hyrelog_deadline", default=None)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Seconds to wait from a ``Retry-After`` header
+
+    Accepts delay-seconds or an HTTP date; anything else is treated as if
+    the header were absent.
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when is None:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
 
 class BaseClient:
     """Base client class with common functionality"""
 
+    # Endpoints used by the shared query/export iterators
+    events_path: str = ""
+    export_path: str = ""
+
     def __init__(self, options: HyreLogClientOptions):
         self.api_key = options.api_key
         self.base_url = options.base_url
         self.debug = options.debug
         self.timeout = options.timeout
         self.retry_config = options.retry_config or RetryConfig()
+        self.metrics = ClientMetrics(type(self).__name__)
+        self.tracing = Tracing(options.tracing, options.trace_sample_rate)
+        self.hedging = options.hedging
+        self.hedge_delay = options.hedge_delay
+        self.hedge_min_samples = options.hedge_min_samples
 
         # Setup logging
         if self.debug:
             logging.basicConfig(level=logging.DEBUG)
 
-        # Create HTTP client
-        self.client = httpx.AsyncClient(
-            timeout=self.timeout,
-            headers={
-                "x-hyrelog-key": self.api_key,
-                "content-type": "application/json",
-            },
+        # HTTP client is created on first request
+        self._client: Optional["httpx.AsyncClient"] = None
+        lifecycle.track(self)
+
+    @property
+    def client(self) -> "httpx.AsyncClient":
+        """HTTP client, created (and httpx imported) on first use"""
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                headers={
+                    "x-hyrelog-key": self.api_key,
+                    "content-type": "application/json",
+                },
+            )
+        return self._client
+
+    @client.setter
+    def client(self, value: "httpx.AsyncClient") -> None:
+        self._client = value
+
+    @contextmanager
+    def deadline(self, seconds: float) -> Iterator[None]:
+        """
+        Bound every request made inside the block, retries included
+
+        Nested deadlines keep the earlier one. The deadline follows the
+        current context, so it also covers iterators and tasks started
+        inside the block.
+        """
+        current = _deadline.get()
+        new = time.monotonic() + seconds
+        token = _deadline.set(new if current is None else min(current, new))
+        try:
+            yield
+        finally:
+            _deadline.reset(token)
+
+    def _deadline_error(self, method: str, url: str) -> TimeoutError:
+        self.metrics.record_deadline_exceeded()
+        return TimeoutError(f"HyreLog request deadline exceeded: {method} {url}")
+
+    def _hedge_after(self) -> Optional[float]:
+        """Seconds before a backup GET is sent: ``hedge_delay`` or the observed p95"""
+        if not self.hedging:
+            return None
+        if self.hedge_delay is not None:
+            return self.hedge_delay
+        latency = self.metrics.request_latency
+        if latency.count < self.hedge_min_samples:
+            return None
+        p95 = latency.percentile(0.95)
+        return p95 / 1000 if p95 is not None else None
+
+    async def _attempt(
+        self,
+        method: str,
+        url: str,
+        content: Optional[bytes],
+        params: Optional[Dict[str, Any]],
+        bytes_sent: int,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> "httpx.Response":
+        """Send one HTTP attempt and record it"""
+        import httpx
+
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(
+                method=method,
+                url=url,
+                content=content,
+                params=params,
+                headers=headers,
+            )
+        except httpx.RequestError:
+            self.metrics.record_request(
+                method, None, (time.perf_counter() - started) * 1000, bytes_sent, 0
+            )
+            raise
+
+        self.metrics.record_request(
+            method,
+            response.status_code,
+            (time.perf_counter() - started) * 1000,
+            bytes_sent,
+            len(response.content),
+        )
+        return response
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        content: Optional[bytes],
+        params: Optional[Dict[str, Any]],
+        bytes_sent: int,
+        remaining: Optional[float],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> "httpx.Response":
+        """
+        One logical attempt, hedged for GETs when enabled
+
+        A GET still unanswered after the hedge delay gets a backup request;
+        the first response wins and the other request is cancelled.
+        """
+        hedge_after = self._hedge_after() if method == "GET" else None
+        if hedge_after is None or (remaining is not None and hedge_after >= remaining):
+            return await self._attempt(method, url, content, params, bytes_sent, headers)
+
+        primary = asyncio.ensure_future(
+            self._attempt(method, url, content, params, bytes_sent, headers)
         )
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=hedge_after)
+            if not done:
+                self.metrics.record_hedge()
+                pending.add(
+                    asyncio.ensure_future(
+                        self._attempt(method, url, content, params, bytes_sent, headers)
+                    )
+                )
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Retrieve every exception so a losing attempt does not warn later
+                errors = [task.exception() for task in done]
+                for task, task_error in zip(done, errors):
+                    if task_error is None:
+                        return task.result()
+                    error = task_error
+            assert error is not None
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
 
     async def _request(
         self,
@@ -45,49 +239,85 @@ class BaseClient:
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
         retry: bool = True,
+        base_url: Optional[str] = None,
+        timeout: Optional[float] = None,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
-        """Make an HTTP request with retry logic"""
-        url = f"{self.base_url}{path}"
-        tracer = trace.get_tracer("hyrelog-sdk")
-        span = tracer.start_span(f"http.{method.lower()}")
+        """
+        Make an HTTP request with retry logic
 
-        try:
-            span.set_attribute("http.method", method)
-            span.set_attribute("http.url", url)
+        ``timeout`` (or an enclosing ``deadline()``) bounds the whole call:
+        each attempt gets the remaining time, and a retry is not started if
+        its backoff plus the median request latency would overrun it.
+        ``body`` sends an already serialized JSON body instead of ``data``.
+        """
+        import httpx
+
+        url = f"{base_url or self.base_url}{path}"
+        deadline = _deadline.get()
+        if timeout is not None:
+            call_deadline = time.monotonic() + timeout
+            deadline = call_deadline if deadline is None else min(deadline, call_deadline)
+
+        with self.tracing.span(
+            f"http.{method.lower()}",
+            attributes={"http.method": method, "http.url": url},
+            kind="client",
+        ) as span:
+            content = body
+            if content is None and data is not None:
+                content = json.dumps(data, separators=(",", ":")).encode()
+            bytes_sent = len(content) if content is not None else 0
 
             delay = self.retry_config.initial_delay
             last_error: Optional[Exception] = None
 
+            def can_retry_after(wait: float) -> bool:
+                if deadline is None:
+                    return True
+                median = self.metrics.request_latency.percentile(0.5) or 0.0
+                return time.monotonic() + wait + median / 1000 < deadline
+
             for attempt in range(self.retry_config.max_retries + 1):
                 try:
                     if self.debug:
                         logger.debug(f"Request: {method} {url}")
 
-                    response = await self.client.request(
-                        method=method,
-                        url=url,
-                        json=data,
-                        params=params,
-                    )
-
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise self._deadline_error(method, url)
+                    try:
+                        response = await asyncio.wait_for(
+                            self._send(
+                                method, url, content, params, bytes_sent, remaining, headers
+                            ),
+                            timeout=remaining,
+                        )
+                    except asyncio.TimeoutError:
+                        raise self._deadline_error(method, url) from last_error
                     span.set_attribute("http.status_code", response.status_code)
 
                     # Check for rate limit headers
                     if response.status_code == 429:
-                        retry_after = response.headers.get("retry-after")
-                        if retry_after:
-                            retry_after_ms = float(retry_after) * 1000
+                        self.metrics.record_rate_limited()
+                        retry_after = _parse_retry_after(response.headers.get("retry-after"))
+                        if retry_after is not None and not can_retry_after(retry_after):
+                            # Retrying sooner than the server asked would only
+                            # be rate limited again
+                            raise self._deadline_error(method, url)
+                        if retry_after is not None:
+                            retry_after_ms = retry_after * 1000
                             if self.debug:
                                 logger.warning(f"Rate limited. Retrying after {retry_after_ms}ms")
+                            self.metrics.record_retry()
                             await asyncio.sleep(retry_after_ms / 1000)
                             continue
 
                     # Parse response
                     if response.status_code >= 400:
                         error_text = response.text
-                        error = Exception(
-                            f"HyreLog API error: {response.status_code} {error_text}"
-                        )
+                        error = Exception(f"HyreLog API error: {response.status_code} {error_text}")
                         error.status_code = response.status_code  # type: ignore
 
                         # Retry on retryable status codes
@@ -95,12 +325,14 @@ class BaseClient:
                             retry
                             and response.status_code in self.retry_config.retryable_status_codes
                             and attempt < self.retry_config.max_retries
+                            and can_retry_after(delay)
                         ):
                             if self.debug:
                                 logger.warning(
                                     f"Retrying after error {response.status_code} "
                                     f"(attempt {attempt + 1}/{self.retry_config.max_retries})"
                                 )
+                            self.metrics.record_retry()
                             await asyncio.sleep(delay)
                             delay = min(
                                 delay * self.retry_config.multiplier,
@@ -109,8 +341,6 @@ class BaseClient:
                             last_error = error
                             continue
 
-                        span.record_exception(error)
-                        span.set_status(trace.Status(trace.StatusCode.ERROR, str(error)))
                         raise error
 
                     result = response.json()
@@ -118,37 +348,149 @@ class BaseClient:
                     if self.debug:
                         logger.debug(f"Response: {response.status_code} {result}")
 
-                    span.set_status(trace.Status(trace.StatusCode.OK))
                     return result
 
                 except httpx.RequestError as e:
                     last_error = e
-                    if attempt < (self.retry_config.max_retries if retry else 0):
+                    if attempt < (
+                        self.retry_config.max_retries if retry else 0
+                    ) and can_retry_after(delay):
                         if self.debug:
                             logger.warning(
                                 f"Retrying after error (attempt {attempt + 1}/{self.retry_config.max_retries}): {e}"
                             )
+                        self.metrics.record_retry()
                         await asyncio.sleep(delay)
                         delay = min(
                             delay * self.retry_config.multiplier,
                             self.retry_config.max_delay,
                         )
                     else:
-                        span.record_exception(e)
-                        span.set_status(trace.Status(trace.StatusCode.ERROR, str(e)))
                         raise
 
             if last_error:
-                span.record_exception(last_error)
-                span.set_status(trace.Status(trace.StatusCode.ERROR, str(last_error)))
                 raise last_error
 
             raise Exception("Request failed after retries")
 
-        finally:
-            span.end()
+    async def iter_events(
+        self, options: Optional[QueryOptions] = None, compact: bool = False
+    ) -> AsyncIterator[Union[Event, CompactEvent]]:
+        """
+        Iterate over every event matching ``options``, page by page
+
+        Pages default to the maximum size unless ``options.limit`` is set.
+        With ``compact=True`` events are yielded as ``CompactEvent`` records.
+        """
+        async for page in self._iter_pages(options):
+            for raw in page.get("data", []):
+                yield CompactEvent.from_api(raw) if compact else Event(**raw)
+
+    async def iter_event_batches(
+        self,
+        options: Optional[QueryOptions] = None,
+        source: str = "query",
+        batch_size: int = 1000,
+    ) -> AsyncIterator[EventBatch]:
+        """
+        Iterate over matching events as columnar ``EventBatch`` objects
+
+        ``source="query"`` yields one batch per page; ``source="export"``
+        streams the export endpoint (from/to/action/category filters only,
+        subject to the plan's export limit) in batches of ``batch_size``.
+        """
+        if source == "query":
+            async for page in self._iter_pages(options):
+                yield EventBatch.from_api(page.get("data", []))
+        elif source == "export":
+            pending = []
+            async for raw in self._iter_export(options):
+                pending.append(raw)
+                if len(pending) >= batch_size:
+                    yield EventBatch.from_api(pending)
+                    pending = []
+            if pending:
+                yield EventBatch.from_api(pending)
+        else:
+            raise ValueError(f"Invalid source: {source}")
+
+    async def iter_export(
+        self, options: Optional[QueryOptions] = None, compact: bool = True
+    ) -> AsyncIterator[Union[Event, CompactEvent]]:
+        """Stream events from the JSON export endpoint without buffering the body"""
+        async for raw in self._iter_export(options):
+            yield CompactEvent.from_api(raw) if compact else Event(**raw)
+
+    async def _iter_pages(self, options: Optional[QueryOptions]) -> AsyncIterator[Dict[str, Any]]:
+        """Raw query responses for consecutive pages"""
+        options = options or QueryOptions()
+        params = options.model_dump(exclude_none=True, by_alias=True)
+        if "limit" not in options.model_fields_set:
+            params["limit"] = ITER_PAGE_SIZE
+        page = options.page or 1
+
+        while True:
+            result = await self._request("GET", self.events_path, params={**params, "page": page})
+            yield result
+            data = result.get("data", [])
+            if not data or page >= result.get("pagination", {}).get("totalPages", 0):
+                return
+            page += 1
+
+    async def _iter_export(self, options: Optional[QueryOptions]) -> AsyncIterator[Dict[str, Any]]:
+        """Raw events from the export endpoint, parsed line by line"""
+        options = options or QueryOptions()
+        params = options.model_dump(exclude_none=True, by_alias=True, include=EXPORT_FILTERS)
+        url = f"{self.base_url}{self.export_path}"
+
+        with self.tracing.span("hyrelog.export", attributes={"http.url": url}, kind="client"):
+            started = time.perf_counter()
+            async with self.client.stream("GET", url, params=params) as response:
+                if response.status_code >= 400:
+                    await response.aread()
+                    self.metrics.record_request(
+                        "GET",
+                        response.status_code,
+                        (time.perf_counter() - started) * 1000,
+                        0,
+                        len(response.content),
+                    )
+                    error = Exception(f"HyreLog API error: {response.status_code} {response.text}")
+                    error.status_code = response.status_code  # type: ignore
+                    raise error
+
+                # The body is "[", then one JSON event per line separated by ",", then "]"
+                async for line in response.aiter_lines():
+                    line = line.strip().rstrip(",")
+                    if line and line not in ("[", "]"):
+                        yield json.loads(line)
+
+                self.metrics.record_request(
+                    "GET",
+                    response.status_code,
+                    (time.perf_counter() - started) * 1000,
+                    0,
+                    response.num_bytes_downloaded,
+                )
+
+    def _after_fork(self) -> None:
+        """
+        Reset process-local state in a forked child
+
+        The inherited connection pool shares sockets with the parent, so it
+        is abandoned rather than closed; the child opens its own on first use.
+        """
+        self._client = None
+        self.metrics = ClientMetrics(type(self).__name__)
+
+    def _drain_at_exit(self) -> None:
+        """Deliver or spill pending work when the interpreter exits"""
+
+    def stats(self) -> ClientStats:
+        """Return a snapshot of request, retry, batch and queue statistics"""
+        return self.metrics.snapshot()
 
     async def close(self):
         """Close the HTTP client"""
-        await self.client.aclose()
-
+        if self._client is not None:
+            await self._client.aclose()
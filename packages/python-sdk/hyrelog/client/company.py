@@ -2,16 +2,37 @@
 Company-level client for read-only operations
 """
 
-from typing import Optional
-from opentelemetry import trace
+import time
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
-from hyrelog.client.base import BaseClient
-from hyrelog.types import QueryOptions, QueryResponse, HyreLogClientOptions
+from hyrelog.client.base import BaseClient, logger
+from hyrelog.client.fanout import (
+    MAX_PAGE_SIZE,
+    RegionQueryError,
+    RegionStream,
+    merge_region_streams,
+)
+from hyrelog.jobs import JobHandle
+from hyrelog.types import (
+    Event,
+    GlobalQueryResponse,
+    Job,
+    QueryOptions,
+    QueryResponse,
+    HyreLogClientOptions,
+    RegionQueryStatus,
+)
+
+# How long get_regions() output is reused for fan-out queries
+REGIONS_CACHE_TTL = 300.0
 
 
 class HyreLogCompanyClient(BaseClient):
     """Company client for querying events across workspaces"""
 
+    events_path = "/v1/key/company/events"
+    export_path = "/v1/key/company/export.json"
+
     def __init__(
         self,
         company_key: str,
@@ -19,6 +40,13 @@ class HyreLogCompanyClient(BaseClient):
         debug: bool = False,
         timeout: float = 30.0,
         retry_config: Optional[dict] = None,
+        tracing: str = "full",
+        trace_sample_rate: float = 1.0,
+        region_endpoints: Optional[Dict[str, str]] = None,
+        region_timeout: float = 10.0,
+        hedging: bool = False,
+        hedge_delay: Optional[float] = None,
+        hedge_min_samples: int = 20,
     ):
         options = HyreLogClientOptions(
             api_key=company_key,
@@ -26,59 +54,203 @@ class HyreLogCompanyClient(BaseClient):
             debug=debug,
             timeout=timeout,
             retry_config=retry_config,
+            tracing=tracing,
+            trace_sample_rate=trace_sample_rate,
+            hedging=hedging,
+            hedge_delay=hedge_delay,
+            hedge_min_samples=hedge_min_samples,
         )
         super().__init__(options)
 
+        # Fan-out configuration: region code (e.g. "AU") -> regional base URL
+        self.region_endpoints = region_endpoints or {}
+        self.region_timeout = region_timeout
+        self._regions_cache: Optional[Tuple[float, List[str]]] = None
+
     async def query_events(self, options: Optional[QueryOptions] = None) -> QueryResponse:
         """Query events across all workspaces in the company"""
         if options is None:
             options = QueryOptions()
 
-        tracer = trace.get_tracer("hyrelog-sdk")
-        span = tracer.start_span("hyrelog.query_company_events")
-
-        try:
+        with self.tracing.span("hyrelog.query_company_events"):
             params = options.model_dump(exclude_none=True, by_alias=True)
             result = await self._request("GET", "/v1/key/company/events", params=params)
-
-            span.set_status(trace.Status(trace.StatusCode.OK))
             return QueryResponse(**result)
-        except Exception as e:
-            span.record_exception(e)
-            span.set_status(trace.Status(trace.StatusCode.ERROR, str(e)))
-            raise
 
-    async def query_global_events(self, options: Optional[QueryOptions] = None) -> QueryResponse:
-        """Query events globally across all regions (Phase 3 feature)"""
+    async def query_global_events(
+        self,
+        options: Optional[QueryOptions] = None,
+        fan_out: Optional[bool] = None,
+        region_timeout: Optional[float] = None,
+    ) -> QueryResponse:
+        """
+        Query events globally across all regions (Phase 3 feature)
+
+        With ``fan_out`` (the default when ``region_endpoints`` is configured)
+        each region is queried concurrently and the results are merged in the
+        SDK, returning a ``GlobalQueryResponse``. Regions that fail, or whose
+        page request exceeds ``region_timeout``, are reported and the response
+        is flagged partial.
+        """
         if options is None:
             options = QueryOptions()
+        if fan_out is None:
+            fan_out = bool(self.region_endpoints)
+        if fan_out:
+            return await self._query_fan_out(options, region_timeout)
 
-        tracer = trace.get_tracer("hyrelog-sdk")
-        span = tracer.start_span("hyrelog.query_global_events")
-
-        try:
+        with self.tracing.span("hyrelog.query_global_events"):
             params = options.model_dump(exclude_none=True, by_alias=True)
             result = await self._request("GET", "/v1/key/company/events/global", params=params)
-
-            span.set_status(trace.Status(trace.StatusCode.OK))
             return QueryResponse(**result)
-        except Exception as e:
-            span.record_exception(e)
-            span.set_status(trace.Status(trace.StatusCode.ERROR, str(e)))
-            raise
 
     async def get_regions(self) -> dict:
         """Get company region information"""
-        tracer = trace.get_tracer("hyrelog-sdk")
-        span = tracer.start_span("hyrelog.get_regions")
+        with self.tracing.span("hyrelog.get_regions"):
+            return await self._request("GET", "/v1/key/company/regions")
+
+    async def request_gdpr_export(self) -> JobHandle:
+        """
+        Queue a GDPR export of all company data
+
+        Not retried, since a repeated request would queue a second export.
+        Await ``wait()`` on the returned handle (or pass several handles to a
+        ``JobScheduler``), then ``save()`` or ``stream()`` the result.
+        """
+        with self.tracing.span("hyrelog.request_gdpr_export"):
+            result = await self._request("POST", "/v1/key/company/gdpr/export", retry=False)
+        job = Job(
+            id=result["jobId"],
+            companyId=result.get("companyId"),
+            type="GDPR_EXPORT",
+            status="PENDING",
+            createdAt=result.get("createdAt"),
+        )
+        return JobHandle(self, job.id, job)
 
+    def job(self, job_id: str) -> JobHandle:
+        """Handle for an existing job, e.g. one queued by an earlier process"""
+        return JobHandle(self, job_id)
+
+    async def stream_global_events(
+        self,
+        options: Optional[QueryOptions] = None,
+        region_timeout: Optional[float] = None,
+        allow_partial: bool = False,
+    ) -> AsyncIterator[Event]:
+        """
+        Stream events from every region, newest first
+
+        Pages are fetched from each region as the merge consumes them, each
+        within ``region_timeout``. A region that fails or times out raises
+        ``RegionQueryError``, so a stream is never silently truncated; with
+        ``allow_partial`` it is logged and the other regions carry on.
+        ``options.page`` is ignored and ``options.limit`` sets the page size.
+        """
+        options = options or QueryOptions()
+        streams, skipped = await self._region_streams(
+            options, min(options.limit or MAX_PAGE_SIZE, MAX_PAGE_SIZE), region_timeout
+        )
+
+        def on_failure(status: RegionQueryStatus) -> None:
+            if not allow_partial:
+                raise RegionQueryError(status)
+            logger.warning(f"Region {status.region} dropped from stream: {status.error}")
+
+        for status in skipped:
+            on_failure(status)
+        merged = merge_region_streams(streams, on_failure)
         try:
-            result = await self._request("GET", "/v1/key/company/regions")
+            async for event in merged:
+                yield Event(**event)
+        finally:
+            await merged.aclose()
+
+    async def _query_fan_out(
+        self, options: QueryOptions, region_timeout: Optional[float]
+    ) -> GlobalQueryResponse:
+        """Query all regions concurrently and merge one page of results"""
+        with self.tracing.span("hyrelog.query_global_events", attributes={"fan_out": True}):
+            page = options.page or 1
+            limit = options.limit or 20
+            offset = (page - 1) * limit
+            streams, skipped = await self._region_streams(
+                options, min(offset + limit, MAX_PAGE_SIZE), region_timeout
+            )
 
-            span.set_status(trace.Status(trace.StatusCode.OK))
-            return result
-        except Exception as e:
-            span.record_exception(e)
-            span.set_status(trace.Status(trace.StatusCode.ERROR, str(e)))
-            raise
+            data: List[Event] = []
+            position = 0
+            merged = merge_region_streams(streams)
+            try:
+                async for event in merged:
+                    if position >= offset:
+                        data.append(Event(**event))
+                        if len(data) >= limit:
+                            break
+                    position += 1
+            finally:
+                await merged.aclose()
+
+            statuses = [stream.status for stream in streams] + skipped
+            # Regions can overlap (replicas), so the total is an upper bound
+            total = sum(status.total or 0 for status in statuses)
+            first = next((s.first_response for s in streams if s.first_response), {})
+            return GlobalQueryResponse(
+                data=data,
+                pagination={
+                    "page": page,
+                    "limit": limit,
+                    "total": total,
+                    "totalPages": (total + limit - 1) // limit,
+                },
+                retention_applied=first.get("retentionApplied"),
+                retention_window_start=first.get("retentionWindowStart"),
+                partial=any(not status.ok for status in statuses),
+                regions=statuses,
+            )
+
+    async def _region_streams(
+        self, options: QueryOptions, page_size: int, region_timeout: Optional[float]
+    ) -> Tuple[List[RegionStream], List[RegionQueryStatus]]:
+        """Build a stream per reachable region plus statuses for unreachable ones"""
+        regions = await self._fan_out_regions()
+        params = options.model_dump(exclude_none=True, by_alias=True, exclude={"page", "limit"})
+        timeout = region_timeout or self.region_timeout
+
+        streams: List[RegionStream] = []
+        skipped: List[RegionQueryStatus] = []
+        for region in regions:
+            base_url = self.region_endpoints.get(region)
+            if base_url is None:
+                skipped.append(
+                    RegionQueryStatus(region=region, ok=False, error="no endpoint configured")
+                )
+                continue
+            streams.append(
+                RegionStream(
+                    self,
+                    region,
+                    base_url,
+                    "/v1/key/company/events",
+                    params,
+                    page_size,
+                    timeout,
+                )
+            )
+        return streams, skipped
+
+    async def _fan_out_regions(self) -> List[str]:
+        """Company regions from get_regions(), cached for REGIONS_CACHE_TTL"""
+        now = time.monotonic()
+        if self._regions_cache and now - self._regions_cache[0] < REGIONS_CACHE_TTL:
+            return self._regions_cache[1]
+
+        try:
+            info = await self.get_regions()
+        except Exception:
+            # Fall back to the configured endpoints without caching
+            return list(self.region_endpoints)
 
+        regions = [info["primary"]["region"]] + [r["region"] for r in info.get("replicas", [])]
+        self._regions_cache = (now, regions)
+        return regions
@@ -0,0 +1,164 @@
+"""
+Concurrent per-region queries merged into a single newest-first stream
+"""
+
+import asyncio
+import heapq
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Tuple
+
+from hyrelog.types import RegionQueryStatus
+
+# Largest page the API serves
+MAX_PAGE_SIZE = 500
+
+
+class RegionQueryError(Exception):
+    """A region failed part-way through a fan-out stream"""
+
+    def __init__(self, status: RegionQueryStatus):
+        super().__init__(f"Region {status.region} failed: {status.error}")
+        self.status = status
+
+
+class _Newest:
+    """Heap key ordering events newest first (createdAt, then id)"""
+
+    __slots__ = ("created_at", "id")
+
+    def __init__(self, event: Dict[str, Any]):
+        # createdAt is always a UTC ISO-8601 string, so it sorts lexicographically
+        self.created_at = event.get("createdAt", "")
+        self.id = event.get("id", "")
+
+    def __lt__(self, other: "_Newest") -> bool:
+        return (self.created_at, self.id) > (other.created_at, other.id)
+
+
+class RegionStream:
+    """Pages through one region's events, buffering raw event dicts"""
+
+    def __init__(
+        self,
+        client: Any,
+        region: str,
+        base_url: str,
+        path: str,
+        params: Dict[str, Any],
+        page_size: int,
+        timeout: float,
+    ):
+        self.client = client
+        self.base_url = base_url
+        self.path = path
+        self.params = params
+        self.page_size = page_size
+        self.timeout = timeout
+        self.buffer: Deque[Dict[str, Any]] = deque()
+        self.page = 0
+        self.exhausted = False
+        self.first_response: Optional[Dict[str, Any]] = None
+        self.status = RegionQueryStatus(region=region, ok=True)
+
+    async def fill(self) -> None:
+        """Fetch the next page, marking the region failed on error or timeout"""
+        if self.exhausted:
+            return
+
+        started = time.perf_counter()
+        try:
+            # The timeout applies to each page, so long streams are not cut off
+            result = await asyncio.wait_for(
+                self.client._request(
+                    "GET",
+                    self.path,
+                    params={**self.params, "page": self.page + 1, "limit": self.page_size},
+                    base_url=self.base_url,
+                ),
+                timeout=self.timeout,
+            )
+        except asyncio.TimeoutError:
+            self._fail("timed out")
+            return
+        except Exception as e:
+            self._fail(str(e))
+            return
+        finally:
+            self.status.latency_ms = (self.status.latency_ms or 0.0) + (
+                time.perf_counter() - started
+            ) * 1000
+
+        self.page += 1
+        data = result.get("data", [])
+        pagination = result.get("pagination", {})
+        if self.first_response is None:
+            self.first_response = result
+            self.status.total = pagination.get("total")
+        self.buffer.extend(data)
+        if len(data) < self.page_size or self.page >= pagination.get("totalPages", 0):
+            self.exhausted = True
+
+    def _fail(self, error: str) -> None:
+        self.status.ok = False
+        self.status.error = error
+        self.exhausted = True
+
+
+async def merge_region_streams(
+    streams: List[RegionStream],
+    on_failure: Optional[Callable[[RegionQueryStatus], None]] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    K-way merge of region streams, newest first
+
+    First pages are fetched concurrently; a region's later pages are fetched
+    only when the merge needs its next event. Events present in several
+    regions (replicas) are yielded once. ``on_failure`` is called with the
+    status of each region that fails; it may raise to end the merge.
+    """
+    await asyncio.gather(*(stream.fill() for stream in streams))
+    if on_failure is not None:
+        for stream in streams:
+            if not stream.status.ok:
+                on_failure(stream.status)
+
+    heap: List[Tuple[_Newest, int]] = []
+    for index, stream in enumerate(streams):
+        if stream.buffer:
+            heap.append((_Newest(stream.buffer[0]), index))
+    heapq.heapify(heap)
+
+    # Replicas of an event share its createdAt, so ids only need to be
+    # remembered until the merge moves past that timestamp
+    seen = set()
+    seen_at: Optional[str] = None
+    while heap:
+        _, index = heapq.heappop(heap)
+        stream = streams[index]
+        if not stream.buffer:
+            # Refill marker: fetch the region's next page only when the merge
+            # actually reaches it
+            await stream.fill()
+            if on_failure is not None and not stream.status.ok:
+                on_failure(stream.status)
+            if stream.buffer:
+                heapq.heappush(heap, (_Newest(stream.buffer[0]), index))
+            continue
+
+        event = stream.buffer.popleft()
+        if stream.buffer:
+            heapq.heappush(heap, (_Newest(stream.buffer[0]), index))
+        elif not stream.exhausted:
+            # Events on later pages are no newer than this one
+            heapq.heappush(heap, (_Newest(event), index))
+
+        created_at = event.get("createdAt", "")
+        if created_at != seen_at:
+            seen.clear()
+            seen_at = created_at
+        event_id = event.get("id")
+        if event_id in seen:
+            continue
+        seen.add(event_id)
+        yield event
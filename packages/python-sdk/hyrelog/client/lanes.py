@@ -0,0 +1,128 @@
+"""
+Priority lanes for batched ingestion
+
+Each lane has its own queue, flush timer, batch size and overflow policy.
+Events are routed to the first lane whose category or action patterns
+match (``fnmatch`` syntax), otherwise to the default lane.
+"""
+
+import asyncio
+import fnmatch
+import random
+import re
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from hyrelog.types import EventInput, LaneConfig
+
+# Distinct (category, action) pairs remembered by the router
+ROUTE_CACHE_SIZE = 4096
+
+
+def _compile_patterns(patterns: Sequence[str]) -> Optional["re.Pattern[str]"]:
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns))
+
+
+class BatchLane:
+    """Queue, timer and overflow policy for one class of events"""
+
+    def __init__(self, config: LaneConfig):
+        if not 0 <= config.sample_rate <= 1:
+            raise ValueError("Lane sample_rate must be between 0 and 1")
+        self.config = config
+        self.name = config.name
+        self.queue: List[EventInput] = []
+        self.oldest_at: Optional[float] = None
+        self.timer: Optional[asyncio.Task] = None
+        self.shed = 0
+        self._categories = _compile_patterns(config.categories)
+        self._actions = _compile_patterns(config.actions)
+
+    def matches(self, category: str, action: str) -> bool:
+        """Whether an event with this category and action belongs to the lane"""
+        return bool(
+            (self._categories is not None and self._categories.match(category))
+            or (self._actions is not None and self._actions.match(action))
+        )
+
+    @property
+    def flush_now(self) -> bool:
+        """Whether the queue should be sent without waiting for the timer"""
+        return self.config.max_wait <= 0 or len(self.queue) >= self.config.max_size
+
+    def offer(self, event: EventInput) -> bool:
+        """
+        Queue an event subject to sampling and the overflow policy
+
+        Returns False if the event itself was discarded; ``shed`` counts
+        every event the lane discarded, including evicted old ones.
+        """
+        config = self.config
+        if config.sample_rate < 1 and random.random() >= config.sample_rate:
+            self.shed += 1
+            return False
+        if config.capacity is not None and len(self.queue) >= config.capacity:
+            if config.overflow == "shed":
+                self.shed += 1
+                return False
+            if config.overflow == "drop_oldest":
+                self.queue.pop(0)
+                self.shed += 1
+        if not self.queue:
+            self.oldest_at = time.monotonic()
+        self.queue.append(event)
+        return True
+
+    def take(self) -> List[EventInput]:
+        """Remove and return everything queued"""
+        events = self.queue
+        self.queue = []
+        self.oldest_at = None
+        return events
+
+    def requeue(self, events: List[EventInput]) -> None:
+        """Put events back at the front of the queue (ignoring capacity)"""
+        if not events:
+            return
+        self.queue[:0] = events
+        if self.oldest_at is None:
+            self.oldest_at = time.monotonic()
+
+    def clear_timer(self) -> None:
+        """Cancel the pending flush timer"""
+        if self.timer and not self.timer.done():
+            self.timer.cancel()
+        self.timer = None
+
+    def reset(self) -> None:
+        """Forget queued events and timers (after a fork)"""
+        self.queue = []
+        self.oldest_at = None
+        self.timer = None
+
+
+class LaneRouter:
+    """Picks the lane for an event, caching the result per category/action"""
+
+    def __init__(self, lanes: Sequence[BatchLane], default: BatchLane):
+        self.lanes = list(lanes)
+        self.default = default
+        self._routes: Dict[Tuple[str, str], BatchLane] = {}
+
+    @property
+    def all(self) -> List[BatchLane]:
+        """Every lane in priority order, the default lane last"""
+        return [*self.lanes, self.default]
+
+    def route(self, event: EventInput) -> BatchLane:
+        """Lane for an event: the first configured lane that matches, else the default"""
+        key = (event.category, event.action)
+        lane = self._routes.get(key)
+        if lane is None:
+            lane = next((lane for lane in self.lanes if lane.matches(*key)), self.default)
+            if len(self._routes) >= ROUTE_CACHE_SIZE:
+                self._routes.clear()
+            self._routes[key] = lane
+        return lane
@@ -0,0 +1,162 @@
+"""
+Latency-aware routing of batch ingestion across regional endpoints
+
+Each region's latency (from probes of its ``/healthz`` endpoint, so regions
+are compared like for like) and error rate (from probes and batch requests) are kept as
+exponentially weighted averages. Batches go to the healthiest region the
+workspace's data residency allows. A region that keeps failing cools down
+and the next one takes over mid-batch, so queued events are not lost.
+"""
+
+import time
+from typing import Dict, List, Optional, Sequence
+
+from hyrelog.types import RegionHealth
+
+# Weight of the newest sample in the moving averages
+LATENCY_ALPHA = 0.3
+ERROR_ALPHA = 0.2
+
+# A region cools down after this many consecutive failures, or once its
+# error rate passes ERROR_RATE_THRESHOLD
+FAILURE_THRESHOLD = 3
+ERROR_RATE_THRESHOLD = 0.5
+
+# The active region is kept unless another scores better by this factor,
+# so routing does not flap between regions with similar latency
+SWITCH_MARGIN = 1.2
+
+
+class RegionState:
+    """Moving latency and error averages for one regional endpoint"""
+
+    def __init__(self, region: str, base_url: str):
+        self.region = region
+        self.base_url = base_url.rstrip("/")
+        self.latency_ms: Optional[float] = None
+        self.error_rate = 0.0
+        self.failures = 0
+        self.samples = 0
+        self.cooldown_until = 0.0
+        self.probed_at: Optional[float] = None
+
+    def available(self, now: float) -> bool:
+        return self.cooldown_until <= now
+
+    @property
+    def score(self) -> float:
+        """Lower is better: latency inflated by the error rate"""
+        assert self.latency_ms is not None
+        return self.latency_ms * (1 + 4 * self.error_rate)
+
+    def record(self, ok: bool, latency_ms: Optional[float], cooldown: float) -> None:
+        self.samples += 1
+        self.error_rate += ERROR_ALPHA * ((0.0 if ok else 1.0) - self.error_rate)
+        if latency_ms is not None:
+            self.latency_ms = (
+                latency_ms
+                if self.latency_ms is None
+                else self.latency_ms + LATENCY_ALPHA * (latency_ms - self.latency_ms)
+            )
+        if ok:
+            self.failures = 0
+            if self.error_rate < ERROR_RATE_THRESHOLD:
+                self.cooldown_until = 0.0
+            return
+        self.failures += 1
+        if self.failures >= FAILURE_THRESHOLD or self.error_rate >= ERROR_RATE_THRESHOLD:
+            self.cooldown_until = time.monotonic() + cooldown
+
+
+class RegionRouter:
+    """Orders allowed regions by health and remembers the active one"""
+
+    def __init__(self, endpoints: Dict[str, str], cooldown: float, probe_interval: float):
+        self.endpoints = endpoints
+        self.cooldown = cooldown
+        self.probe_interval = probe_interval
+        self.states: Dict[str, RegionState] = {
+            region: RegionState(region, url) for region, url in endpoints.items()
+        }
+        self.current: Optional[str] = None
+
+    def configure(self, allowed: Sequence[str], unhealthy: Sequence[str] = ()) -> None:
+        """
+        Restrict routing to ``allowed`` regions, preferred in that order
+
+        Regions reported unhealthy start cooled down.
+        """
+        self.states = {
+            region: self.states.get(region) or RegionState(region, self.endpoints[region])
+            for region in allowed
+            if region in self.endpoints
+        }
+        for region in unhealthy:
+            if region in self.states:
+                self.states[region].cooldown_until = time.monotonic() + self.cooldown
+
+    def candidates(self) -> List[RegionState]:
+        """
+        Regions to try, best first
+
+        Measured regions by score, then unmeasured ones in preference order,
+        then cooled-down regions as a last resort.
+        """
+        now = time.monotonic()
+        available = [s for s in self.states.values() if s.available(now)]
+        measured = sorted((s for s in available if s.latency_ms is not None), key=lambda s: s.score)
+        ordered = measured + [s for s in available if s.latency_ms is None]
+        current = self.states.get(self.current) if self.current else None
+        if (
+            current in ordered
+            and measured
+            and current is not measured[0]
+            and (current.latency_ms is None or current.score <= measured[0].score * SWITCH_MARGIN)
+        ):
+            ordered.remove(current)
+            ordered.insert(0, current)
+        cooling = sorted(
+            (s for s in self.states.values() if not s.available(now)),
+            key=lambda s: s.cooldown_until,
+        )
+        return ordered + cooling
+
+    def record(self, region: str, ok: bool, latency_ms: Optional[float] = None) -> None:
+        state = self.states.get(region)
+        if state is not None:
+            state.record(ok, latency_ms, self.cooldown)
+
+    def is_available(self, region: str) -> bool:
+        """Whether a region is allowed and not cooling down"""
+        state = self.states.get(region)
+        return state is not None and state.available(time.monotonic())
+
+    def activate(self, region: str) -> Optional[str]:
+        """Make ``region`` the active one; returns the region it replaced, if any"""
+        previous = self.current
+        self.current = region
+        return previous if previous is not None and previous != region else None
+
+    def due_for_probe(self) -> List[RegionState]:
+        """Regions whose latency has not been measured within ``probe_interval``"""
+        now = time.monotonic()
+        return [
+            s
+            for s in self.states.values()
+            if s.probed_at is None or now - s.probed_at >= self.probe_interval
+        ]
+
+    def health(self) -> List[RegionHealth]:
+        now = time.monotonic()
+        return [
+            RegionHealth(
+                region=s.region,
+                base_url=s.base_url,
+                latency_ms=s.latency_ms,
+                error_rate=s.error_rate,
+                healthy=s.available(now),
+                active=s.region == self.current,
+                samples=s.samples,
+            )
+            for s in self.states.values()
+        ]
@@ -3,10 +3,19 @@ Workspace-level client for event ingestion and querying
 """
 
 import asyncio
-from typing import List, Optional
-from opentelemetry import trace
-
-from hyrelog.client.base import BaseClient
+import json
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from hyrelog.client.base import BaseClient, logger
+from hyrelog.client.lanes import BatchLane, LaneRouter
+from hyrelog.client.regions import RegionRouter, RegionState
+from hyrelog.collector import CollectorConnection
+from hyrelog.processors import Pipeline
+from hyrelog.schemas import SchemaRegistry
+from hyrelog.spool import Spool
+from hyrelog.tracing import current_trace_context
 from hyrelog.types import (
     EventInput,
     Event,
@@ -14,12 +23,24 @@ from hyrelog.types import (
     QueryResponse,
     BatchOptions,
     HyreLogClientOptions,
+    LaneConfig,
+    ProcessorOptions,
+    QuarantinedEvent,
+    RegionHealth,
 )
 
+BATCH_PATH = "/v1/key/workspace/events/batch"
+
+# Unauthenticated liveness endpoint timed by region probes
+PROBE_PATH = "/healthz"
+
 
 class HyreLogWorkspaceClient(BaseClient):
     """Workspace client for ingesting and querying events"""
 
+    events_path = "/v1/key/workspace/events"
+    export_path = "/v1/key/workspace/export.json"
+
     def __init__(
         self,
         workspace_key: str,
@@ -28,6 +49,25 @@ class HyreLogWorkspaceClient(BaseClient):
         timeout: float = 30.0,
         retry_config: Optional[dict] = None,
         batch_config: Optional[dict] = None,
+        tracing: str = "full",
+        trace_sample_rate: float = 1.0,
+        capture_trace_context: bool = True,
+        validate_schemas: str = "off",
+        schema_refresh_interval: float = 300.0,
+        quarantine_size: int = 1000,
+        spool_dir: Optional[str] = None,
+        shutdown_timeout: float = 5.0,
+        collector_socket: Optional[str] = None,
+        lanes: Optional[Sequence[Union[LaneConfig, dict]]] = None,
+        processors: Optional[Union[ProcessorOptions, dict]] = None,
+        hedging: bool = False,
+        hedge_delay: Optional[float] = None,
+        hedge_min_samples: int = 20,
+        region_endpoints: Optional[Dict[str, str]] = None,
+        data_regions: Optional[Sequence[str]] = None,
+        region_info: Optional[Dict[str, Any]] = None,
+        region_probe_interval: float = 30.0,
+        region_cooldown: float = 30.0,
     ):
         options = HyreLogClientOptions(
             api_key=workspace_key,
@@ -36,133 +76,619 @@ class HyreLogWorkspaceClient(BaseClient):
             timeout=timeout,
             retry_config=retry_config,
             batch_config=batch_config,
+            tracing=tracing,
+            trace_sample_rate=trace_sample_rate,
+            capture_trace_context=capture_trace_context,
+            validate_schemas=validate_schemas,
+            schema_refresh_interval=schema_refresh_interval,
+            spool_dir=spool_dir,
+            shutdown_timeout=shutdown_timeout,
+            collector_socket=collector_socket,
+            lanes=list(lanes or []),
+            processors=processors,
+            hedging=hedging,
+            hedge_delay=hedge_delay,
+            hedge_min_samples=hedge_min_samples,
+            region_endpoints=region_endpoints,
+            data_regions=list(data_regions) if data_regions is not None else None,
+            region_info=region_info,
+            region_probe_interval=region_probe_interval,
+            region_cooldown=region_cooldown,
         )
+        # Checked before the base client registers any shutdown hooks
+        allowed_regions = self._allowed_regions(options) if options.region_endpoints else None
         super().__init__(options)
+        self.capture_trace_context = options.capture_trace_context
+
+        # Schema validation of queued events ("off", "enqueue" or "background")
+        self.validate_schemas = options.validate_schemas
+        self.schemas = SchemaRegistry(self, options.schema_refresh_interval)
+        self.quarantine: Deque[QuarantinedEvent] = deque(maxlen=quarantine_size)
+
+        # Undelivered events are written here instead of being dropped
+        self.spool = Spool(options.spool_dir) if options.spool_dir else None
+        self.shutdown_timeout = options.shutdown_timeout
+
+        # Redaction, size caps and sampling, applied when events are sent
+        self.pipeline = Pipeline(options.processors)
+
+        # Batches go to a local collector daemon instead of the API when set
+        self.collector = (
+            CollectorConnection(options.collector_socket) if options.collector_socket else None
+        )
+
+        # Batches are routed across regional endpoints (region code -> base
+        # URL) when configured, limited to the regions residency allows
+        self.regions: Optional[RegionRouter] = None
+        if options.region_endpoints and allowed_regions is not None:
+            self.regions = RegionRouter(
+                options.region_endpoints,
+                options.region_cooldown,
+                options.region_probe_interval,
+            )
+            self.regions.configure(*allowed_regions)
+        self._region_probe: Optional[asyncio.Task] = None
 
         # Batch configuration
         self.batch_config = batch_config or {}
-        self.batch_queue: List[EventInput] = []
-        self.batch_timer: Optional[asyncio.Task] = None
+        self._flush_tasks: Set[asyncio.Task] = set()
         self.max_batch_size = self.batch_config.get("max_size", 100)
         self.max_wait = self.batch_config.get("max_wait", 5.0)
         self.auto_flush = self.batch_config.get("auto_flush", False)
 
+        # Priority lanes, each with its own queue and timer; events matching
+        # no lane use the default lane built from batch_config
+        default_lane = BatchLane(
+            LaneConfig(name="default", max_size=self.max_batch_size, max_wait=self.max_wait)
+        )
+        self.lanes = LaneRouter([BatchLane(config) for config in options.lanes], default_lane)
+        self.metrics.set_queue_probe(self._queue_stats)
+
         if self.auto_flush:
             self._start_batch_timer()
 
     async def log_event(self, event: EventInput) -> Event:
         """Log a single event"""
-        tracer = trace.get_tracer("hyrelog-sdk")
-        span = tracer.start_span("hyrelog.log_event")
-
-        try:
-            span.set_attribute("event.action", event.action)
-            span.set_attribute("event.category", event.category)
-
-            result = await self._request(
-                "POST",
-                "/v1/key/workspace/events",
-                data=event.model_dump(exclude_none=True, by_alias=True),
-            )
-
-            span.set_status(trace.Status(trace.StatusCode.OK))
+        event = self._with_trace_context(event)
+        with self.tracing.span(
+            "hyrelog.log_event",
+            attributes={"event.action": event.action, "event.category": event.category},
+            sampled=True,
+        ):
+            data = event.model_dump(exclude_none=True, by_alias=True)
+            if self.pipeline.active:
+                # Sampling only applies to batched events
+                data = self.pipeline(data, sample=False)
+                if data is None:
+                    raise ValueError(
+                        f"Event exceeds max_event_bytes ({self.pipeline.options.max_event_bytes})"
+                    )
+            result = await self._request("POST", "/v1/key/workspace/events", data=data)
             return Event(**result)
-        except Exception as e:
-            span.record_exception(e)
-            span.set_status(trace.Status(trace.StatusCode.ERROR, str(e)))
-            raise
 
     async def log_batch(self, events: List[EventInput]) -> List[Event]:
-        """Log multiple events in a batch"""
+        """
+        Log multiple events in a batch
+
+        In collector mode the events are handed to the local collector and
+        an empty list is returned; the collector delivers them.
+        """
         if not events:
             return []
+        return await self._send_payloads([data for _, data in self._prepare(events)])
 
-        tracer = trace.get_tracer("hyrelog-sdk")
-        span = tracer.start_span("hyrelog.log_batch")
+    async def _send_payloads(
+        self, payloads: List[Dict[str, Any]], batch_size: Optional[int] = None
+    ) -> List[Event]:
+        """Send serialized events in chunks of ``batch_size`` (default ``max_batch_size``)"""
+        if not payloads:
+            return []
+        batch_size = batch_size or self.max_batch_size
 
-        try:
-            span.set_attribute("batch.size", len(events))
+        with self.tracing.span(
+            "hyrelog.log_batch", attributes={"batch.size": len(payloads)}, sampled=True
+        ):
+            all_events: List[Event] = []
+            for i in range(0, len(payloads), batch_size):
+                chunk = payloads[i : i + batch_size]
+                if self.collector is not None:
+                    await self.collector.send(chunk)
+                    self.metrics.record_batch(len(chunk))
+                    continue
+                result = await self._post_batch(chunk)
+                self.metrics.record_batch(len(chunk))
+                all_events.extend([Event(**e) for e in result.get("events", [])])
 
-            # Split into chunks if batch is too large
-            chunks: List[List[EventInput]] = []
-            for i in range(0, len(events), self.max_batch_size):
-                chunks.append(events[i : i + self.max_batch_size])
+            return all_events
 
-            all_events: List[Event] = []
-            for chunk in chunks:
+    async def _post_batch(self, chunk: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        POST one batch, to the healthiest allowed region when routing is on
+
+        A region that fails with a network error or retryable status is
+        marked down and the batch moves to the next region. Backoff applies
+        only once every region has failed.
+        """
+        if self.regions is None:
+            return await self._request("POST", BATCH_PATH, data={"events": chunk})
+
+        import httpx
+
+        self._probe_regions_in_background()
+        body = json.dumps({"events": chunk}, separators=(",", ":")).encode()
+        delay = self.retry_config.initial_delay
+        failed: Set[str] = set()
+        last_error: Optional[Exception] = None
+        for attempt in range(self.retry_config.max_retries + 1):
+            candidates = [s for s in self.regions.candidates() if s.region not in failed]
+            if not candidates:
+                # Every region failed this batch: back off, then start over
+                await asyncio.sleep(delay)
+                delay = min(delay * self.retry_config.multiplier, self.retry_config.max_delay)
+                failed.clear()
+                candidates = self.regions.candidates()
+            region = candidates[0]
+            previous = self.regions.activate(region.region)
+            if previous is not None:
+                if previous in failed or not self.regions.is_available(previous):
+                    logger.warning(
+                        f"HyreLog ingestion failing over from {previous} to {region.region}"
+                    )
+                    self.metrics.record_failover(previous, region.region)
+                else:
+                    logger.debug(f"HyreLog ingestion moved from {previous} to {region.region}")
+            try:
                 result = await self._request(
-                    "POST",
-                    "/v1/key/workspace/events/batch",
-                    data={"events": [e.model_dump(exclude_none=True, by_alias=True) for e in chunk]},
+                    "POST", BATCH_PATH, body=body, retry=False, base_url=region.base_url
                 )
-                all_events.extend([Event(**e) for e in result.get("events", [])])
+            except Exception as e:
+                status = getattr(e, "status_code", None)
+                if not (
+                    isinstance(e, (httpx.RequestError, TimeoutError))
+                    or status in self.retry_config.retryable_status_codes
+                ):
+                    raise
+                self.regions.record(region.region, ok=False)
+                failed.add(region.region)
+                last_error = e
+                if attempt < self.retry_config.max_retries:
+                    self.metrics.record_retry()
+                continue
+            self.regions.record(region.region, ok=True)
+            self._probe_regions_in_background()
+            return result
+
+        assert last_error is not None
+        raise last_error
+
+    @staticmethod
+    def _allowed_regions(options: HyreLogClientOptions) -> Tuple[List[str], List[str]]:
+        """
+        Regions that may receive this workspace's events, and those reported unhealthy
+
+        ``region_info`` (the company client's ``get_regions()`` output) gives
+        the company's primary and replica regions, narrowed by
+        ``data_regions``; otherwise ``data_regions`` is used in the order
+        given. With neither, events stay in the region whose endpoint is
+        ``base_url``, so residency is never widened to every endpoint.
+        """
+        assert options.region_endpoints is not None
+        allowed = options.data_regions
+        unhealthy: List[str] = []
+        if options.region_info is not None:
+            info = options.region_info
+            entries = [info["primary"], *info.get("replicas", [])]
+            allowed = [
+                entry["region"]
+                for entry in entries
+                if allowed is None or entry["region"] in allowed
+            ]
+            unhealthy = [entry["region"] for entry in entries if not entry.get("healthy", True)]
+        if allowed is None:
+            base_url = options.base_url.rstrip("/")
+            allowed = [
+                region
+                for region, url in options.region_endpoints.items()
+                if url.rstrip("/") == base_url
+            ][:1]
+            if not allowed:
+                raise ValueError(
+                    "region_endpoints requires data_regions or region_info "
+                    "unless one of its endpoints is base_url"
+                )
+        if not any(region in options.region_endpoints for region in allowed):
+            raise ValueError("No region in region_endpoints is allowed by data_regions")
+        return allowed, unhealthy
+
+    def _probe_regions_in_background(self) -> None:
+        """Start a latency probe if any region's measurement is stale"""
+        if self.regions is None or (self._region_probe and not self._region_probe.done()):
+            return
+        due = self.regions.due_for_probe()
+        if due:
+            self._region_probe = asyncio.ensure_future(self._probe_regions(due))
+
+    async def _probe_regions(self, states: Sequence[RegionState]) -> None:
+        """
+        Time a GET of each region's health endpoint
+
+        Probes bypass ``_request``, so they are never hedged and their
+        timings feed only the region router, not request metrics or the
+        latency estimates behind hedging and deadlines.
+        """
+        assert self.regions is not None
+        regions = self.regions
+
+        async def probe(state: RegionState) -> None:
+            started = time.perf_counter()
+            try:
+                response = await self.client.get(
+                    f"{state.base_url}{PROBE_PATH}", timeout=min(self.timeout, 5.0)
+                )
+                if response.status_code >= 400:
+                    raise Exception(f"HTTP {response.status_code}")
+            except Exception as e:
+                logger.debug(f"HyreLog region probe {state.region} failed: {e}")
+                regions.record(state.region, ok=False)
+            else:
+                regions.record(
+                    state.region, ok=True, latency_ms=(time.perf_counter() - started) * 1000
+                )
+            state.probed_at = time.monotonic()
 
-            span.set_status(trace.Status(trace.StatusCode.OK))
-            return all_events
-        except Exception as e:
-            span.record_exception(e)
-            span.set_status(trace.Status(trace.StatusCode.ERROR, str(e)))
-            raise
+        await asyncio.gather(*(probe(state) for state in states))
 
-    async def queue_event(self, event: EventInput):
-        """Queue an event for batch ingestion (if autoFlush is enabled)"""
-        self.batch_queue.append(event)
+    def region_health(self) -> List[RegionHealth]:
+        """Latency, error rate and status of each region batches may be routed to"""
+        return self.regions.health() if self.regions is not None else []
 
-        if len(self.batch_queue) >= self.max_batch_size:
-            await self.flush_batch()
-        elif self.auto_flush and not self.batch_timer:
-            self._start_batch_timer()
+    @property
+    def batch_queue(self) -> List[EventInput]:
+        """Events waiting in the default lane"""
+        return self.lanes.default.queue
 
-    async def flush_batch(self) -> List[Event]:
-        """Flush queued events"""
-        if not self.batch_queue:
+    @property
+    def batch_timer(self) -> Optional[asyncio.Task]:
+        """Pending flush timer of the default lane"""
+        return self.lanes.default.timer
+
+    async def queue_event(self, event: EventInput):
+        """
+        Queue an event for batch ingestion (if autoFlush is enabled)
+
+        Queued events are traced per flushed batch, not per event.
+        """
+        if self.validate_schemas == "enqueue":
+            try:
+                await self.schemas.ensure_fresh()
+            except Exception as e:
+                logger.warning(f"HyreLog schema refresh failed: {e}")
+            if not self._accept(event):
+                return
+        lane = self._offer(self._with_trace_context(event))
+        if lane is None:
+            return
+
+        if lane.flush_now:
+            await self.flush_batch(lane.name)
+        elif self.auto_flush and not lane.timer:
+            self._start_batch_timer(lane)
+
+    def enqueue_event(self, event: EventInput) -> None:
+        """
+        Queue an event without awaiting any network I/O
+
+        Must be called from a running event loop. Full batches are sent by a
+        background task and partial batches are flushed after ``max_wait``
+        regardless of ``auto_flush``. Delivery errors are logged, not raised.
+        With ``validate_schemas="enqueue"`` the event is checked against the
+        cached schemas, which are refreshed in the background.
+        """
+        if self.validate_schemas == "enqueue":
+            self.schemas.refresh_in_background()
+            if not self._accept(event):
+                return
+        lane = self._offer(self._with_trace_context(event))
+        if lane is None:
+            return
+
+        if lane.flush_now:
+            lane.clear_timer()
+            self._track_flush(asyncio.create_task(self._flush_in_background(lane)))
+        elif not lane.timer:
+            self._start_batch_timer(lane)
+
+    async def flush_batch(self, lane: Optional[str] = None) -> List[Event]:
+        """
+        Flush queued events
+
+        Flushes every lane in priority order, or only the named lane. If a
+        lane fails the remaining lanes are still flushed and the first error
+        is raised afterwards.
+        """
+        lanes = self.lanes.all
+        if lane is not None:
+            lanes = [item for item in lanes if item.name == lane]
+            if not lanes:
+                raise ValueError(f"Unknown lane: {lane}")
+
+        sent: List[Event] = []
+        first_error: Optional[Exception] = None
+        for batch_lane in lanes:
+            try:
+                sent.extend(await self._flush_lane(batch_lane))
+            except Exception as e:
+                first_error = first_error or e
+        if first_error is not None:
+            raise first_error
+        return sent
+
+    async def _flush_lane(self, lane: BatchLane) -> List[Event]:
+        """
+        Send one lane's queue in requests of the lane's ``max_size``
+
+        What is not delivered is spilled, or requeued by a lane that never
+        drops events when there is no spool.
+        """
+        if not lane.queue:
             return []
 
-        events = self.batch_queue.copy()
-        self.batch_queue.clear()
-        self._clear_batch_timer()
+        events = lane.take()
+        lane.clear_timer()
 
-        return await self.log_batch(events)
+        sent_before = self.metrics.events_sent
+        prepared: Optional[List[Tuple[EventInput, Dict[str, Any]]]] = None
+        try:
+            if self.validate_schemas == "background":
+                try:
+                    await self.schemas.ensure_fresh()
+                except Exception as e:
+                    logger.warning(f"HyreLog schema refresh failed: {e}")
+                events = [event for event in events if self._accept(event)]
+            prepared = self._prepare(events)
+            return await self._send_payloads([data for _, data in prepared], lane.config.max_size)
+        except asyncio.CancelledError:
+            # Interrupted (close() deadline, loop shutdown): put the unsent
+            # events back so the caller can drain or spill them
+            sent = self.metrics.events_sent - sent_before
+            lane.requeue(events if prepared is None else [e for e, _ in prepared[sent:]])
+            raise
+        except Exception:
+            # Chunks accepted before the failure are neither spilled nor
+            # dropped; the rest is spilled already processed (redacted), or
+            # goes back to a "keep" lane to be sent with its next flush
+            sent = self.metrics.events_sent - sent_before
+            if self.spool is None and lane.config.overflow == "keep":
+                lane.requeue(events if prepared is None else [e for e, _ in prepared[sent:]])
+            else:
+                self._spill(events if prepared is None else [data for _, data in prepared[sent:]])
+            raise
 
     async def query_events(self, options: Optional[QueryOptions] = None) -> QueryResponse:
         """Query events for this workspace"""
         if options is None:
             options = QueryOptions()
 
-        tracer = trace.get_tracer("hyrelog-sdk")
-        span = tracer.start_span("hyrelog.query_events")
-
-        try:
+        with self.tracing.span("hyrelog.query_events"):
             params = options.model_dump(exclude_none=True, by_alias=True)
             result = await self._request("GET", "/v1/key/workspace/events", params=params)
-
-            span.set_status(trace.Status(trace.StatusCode.OK))
             return QueryResponse(**result)
+
+    async def replay_spool(self) -> int:
+        """
+        Resend events spilled to ``spool_dir``, oldest file first
+
+        Each file is deleted once its events are accepted; replay stops at
+        the first failure. Returns the number of events delivered.
+        """
+        if self.spool is None:
+            return 0
+        delivered = 0
+        for path in self.spool.files():
+            events = self.spool.read(path)
+            await self.log_batch(events)
+            self.spool.remove(path)
+            delivered += len(events)
+        return delivered
+
+    def drain_quarantine(self) -> List[QuarantinedEvent]:
+        """Remove and return the events held back by schema validation"""
+        quarantined = list(self.quarantine)
+        self.quarantine.clear()
+        return quarantined
+
+    def _accept(self, event: EventInput) -> bool:
+        """Validate an event against the cached schemas, quarantining it on failure"""
+        errors = self.schemas.validate(event)
+        if not errors:
+            return True
+        schema = self.schemas.schemas.get(event.action)
+        self.quarantine.append(
+            QuarantinedEvent(
+                event=event,
+                errors=errors,
+                schema_version=schema.version if schema else None,
+                quarantined_at=time.time(),
+            )
+        )
+        self.metrics.record_quarantined()
+        logger.warning(f"HyreLog event {event.action!r} quarantined: {'; '.join(errors)}")
+        return False
+
+    def _with_trace_context(self, event: EventInput) -> EventInput:
+        """
+        Attach the caller's active trace and span ids to an event
+
+        Captured when the event is logged or queued, so batches flushed later
+        keep the context of the code that produced each event. Events that
+        already carry a trace id are returned unchanged.
+        """
+        if not self.capture_trace_context or event.trace_id is not None:
+            return event
+        context = current_trace_context()
+        if context is None:
+            return event
+        return event.model_copy(update={"trace_id": context[0], "span_id": context[1]})
+
+    def _prepare(self, events: List[EventInput]) -> List[Tuple[EventInput, Dict[str, Any]]]:
+        """Serialize events and run the processor pipeline, dropping discarded ones"""
+        prepared = []
+        pipeline = self.pipeline
+        if not pipeline.active:
+            return [(event, event.model_dump(exclude_none=True, by_alias=True)) for event in events]
+
+        sampled_before, oversized_before = pipeline.sampled_out, pipeline.oversized
+        for event in events:
+            data = pipeline(event.model_dump(exclude_none=True, by_alias=True))
+            if data is not None:
+                prepared.append((event, data))
+        self.metrics.record_sampled_out(pipeline.sampled_out - sampled_before)
+        oversized = pipeline.oversized - oversized_before
+        if oversized:
+            logger.warning(f"HyreLog dropped {oversized} events over max_event_bytes")
+            self.metrics.record_dropped(oversized)
+        return prepared
+
+    def _offer(self, event: EventInput) -> Optional[BatchLane]:
+        """Queue an event in its lane; None if the lane discarded it"""
+        lane = self.lanes.route(event)
+        shed_before = lane.shed
+        queued = lane.offer(event)
+        self.metrics.record_shed(lane.shed - shed_before, lane.name)
+        return lane if queued else None
+
+    def _spill(self, events: Sequence[Union[EventInput, Dict[str, Any]]]) -> None:
+        """Write undeliverable events to the spool, or count them as dropped"""
+        if not events:
+            return
+        if self.spool is None:
+            self.metrics.record_dropped(len(events))
+            return
+        try:
+            path = self.spool.write(events)
+            logger.warning(f"HyreLog spilled {len(events)} undelivered events to {path}")
+        except OSError as e:
+            logger.error(f"HyreLog could not spill {len(events)} events: {e}")
+            self.metrics.record_dropped(len(events))
+
+    def _queue_stats(self) -> Tuple[int, Optional[float]]:
+        """Queue depth and age of the oldest queued event in seconds, across lanes"""
+        lanes = self.lanes.all
+        depth = sum(len(lane.queue) for lane in lanes)
+        oldest = [lane.oldest_at for lane in lanes if lane.oldest_at is not None]
+        if not oldest:
+            return depth, None
+        return depth, time.monotonic() - min(oldest)
+
+    async def _flush_in_background(self, lane: Optional[BatchLane] = None) -> None:
+        """Flush from a background task, logging instead of raising"""
+        try:
+            if lane is None:
+                await self.flush_batch()
+            else:
+                await self._flush_lane(lane)
         except Exception as e:
-            span.record_exception(e)
-            span.set_status(trace.Status(trace.StatusCode.ERROR, str(e)))
-            raise
+            logger.error(f"HyreLog background flush failed: {e}")
 
-    def _start_batch_timer(self):
+    def _track_flush(self, task: asyncio.Task) -> None:
+        """Keep a reference to a background flush until it completes"""
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    def _start_batch_timer(self, lane: Optional[BatchLane] = None):
         """Start batch timer for auto-flush"""
-        self._clear_batch_timer()
+        lane = lane or self.lanes.default
+        lane.clear_timer()
 
         async def flush_after_delay():
-            await asyncio.sleep(self.max_wait)
-            await self.flush_batch()
+            await asyncio.sleep(lane.config.max_wait)
+            # Detach first so the flush does not cancel this task, and let
+            # close() wait for the flush instead
+            lane.timer = None
+            self._track_flush(asyncio.current_task())
+            await self._flush_in_background(lane)
 
-        self.batch_timer = asyncio.create_task(flush_after_delay())
+        lane.timer = asyncio.create_task(flush_after_delay())
 
     def _clear_batch_timer(self):
-        """Clear batch timer"""
-        if self.batch_timer and not self.batch_timer.done():
-            self.batch_timer.cancel()
-        self.batch_timer = None
-
-    async def close(self):
-        """Cleanup resources"""
-        self._clear_batch_timer()
-        if self.batch_queue:
+        """Clear every lane's batch timer"""
+        for lane in self.lanes.all:
+            lane.clear_timer()
+
+    def _take_all(self) -> List[EventInput]:
+        """Remove and return every queued event, highest priority lane first"""
+        return [event for lane in self.lanes.all for event in lane.take()]
+
+    async def _drain(self) -> None:
+        """Wait for background flushes, then send everything still queued"""
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+        while any(lane.queue for lane in self.lanes.all):
             await self.flush_batch()
-        await super().close()
 
+    async def close(self, timeout: Optional[float] = None):
+        """
+        Flush queued events and release resources
+
+        Delivery gets at most ``timeout`` seconds (``shutdown_timeout`` by
+        default), retries included; events still unsent at the deadline are
+        spilled to ``spool_dir``, or dropped and counted if there is none.
+        """
+        self._clear_batch_timer()
+        self.schemas.close()
+        if self._region_probe is not None:
+            self._region_probe.cancel()
+        timeout = self.shutdown_timeout if timeout is None else timeout
+        try:
+            await asyncio.wait_for(self._drain(), timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"HyreLog close timed out after {timeout}s")
+            self._spill(self._take_all())
+        finally:
+            if self.collector is not None:
+                await self.collector.close()
+            await super().close()
+
+    def _after_fork(self) -> None:
+        """
+        Reset queues and timers in a forked child
+
+        Queued events belong to the parent, which still delivers them; the
+        inherited timer and flush tasks belong to the parent's event loop.
+        """
+        super()._after_fork()
+        for lane in self.lanes.all:
+            lane.reset()
+        self._flush_tasks = set()
+        self.schemas._refresh_task = None
+        self._region_probe = None
+        self.metrics.set_queue_probe(self._queue_stats)
+        if self.collector is not None:
+            self.collector = CollectorConnection(self.collector.socket_path)
+
+    def _drain_at_exit(self) -> None:
+        """
+        Deliver events left in the queue when the interpreter exits
+
+        The application's event loop is gone by now, so its tasks are
+        discarded and the queue is drained on a fresh loop (and connection
+        pool) under the ``shutdown_timeout`` deadline.
+        """
+        lanes = self.lanes.all
+        if not any(lane.queue for lane in lanes):
+            return
+        for lane in lanes:
+            lane.timer = None
+        self._flush_tasks = set()
+        self.schemas._refresh_task = None
+        self._region_probe = None
+        self._client = None
+        if self.collector is not None:
+            self.collector = CollectorConnection(self.collector.socket_path)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self.close())
+        else:
+            # Exiting from inside a running loop: there is no time to send
+            self._spill(self._take_all())
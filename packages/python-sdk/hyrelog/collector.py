@@ -0,0 +1,273 @@
+"""
+Local aggregator daemon
+
+The collector listens on a Unix domain socket for NDJSON events from any
+number of local processes, coalesces them into batches and delivers them
+through one workspace client, so the host has a single connection pool and
+a single spool. Run it with ``python -m hyrelog collector``.
+
+Each line on the socket is either an event (``EventInput`` JSON, no reply)
+or a control request ``{"op": "health"}`` / ``{"op": "stats"}``, answered
+with one JSON line.
+"""
+
+import asyncio
+import json
+import os
+import signal
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from hyrelog.client.base import logger
+from hyrelog.types import EventInput
+
+if TYPE_CHECKING:
+    from hyrelog.client.workspace import HyreLogWorkspaceClient
+
+DEFAULT_SOCKET_PATH = "/tmp/hyrelog.sock"
+
+# Longest accepted NDJSON line
+MAX_LINE_BYTES = 1024 * 1024
+
+
+class Collector:
+    """Unix socket server batching events into one workspace client"""
+
+    def __init__(
+        self,
+        workspace_key: str,
+        socket_path: str = DEFAULT_SOCKET_PATH,
+        base_url: str = "https://api.hyrelog.com",
+        spool_dir: Optional[str] = None,
+        max_batch_size: int = 100,
+        max_wait: float = 1.0,
+        http_port: Optional[int] = None,
+        shutdown_timeout: float = 10.0,
+    ):
+        from hyrelog.client.workspace import HyreLogWorkspaceClient
+
+        self.socket_path = socket_path
+        self.http_port = http_port
+        self.client: "HyreLogWorkspaceClient" = HyreLogWorkspaceClient(
+            workspace_key=workspace_key,
+            base_url=base_url,
+            batch_config={"max_size": max_batch_size, "max_wait": max_wait},
+            spool_dir=spool_dir,
+            shutdown_timeout=shutdown_timeout,
+        )
+        self.started_at: Optional[float] = None
+        self.connections = 0
+        self.events_received = 0
+        self.invalid_lines = 0
+        self._servers: List[asyncio.AbstractServer] = []
+        self._stopped: Optional[asyncio.Event] = None
+
+    async def start(self) -> None:
+        """Replay the spool and start listening"""
+        if self.client.spool is not None:
+            try:
+                replayed = await self.client.replay_spool()
+                if replayed:
+                    logger.info(f"HyreLog collector replayed {replayed} spooled events")
+            except Exception as e:
+                logger.warning(f"HyreLog collector spool replay failed: {e}")
+
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        self._servers.append(
+            await asyncio.start_unix_server(
+                self._handle_connection, path=self.socket_path, limit=MAX_LINE_BYTES
+            )
+        )
+        if self.http_port is not None:
+            self._servers.append(
+                await asyncio.start_server(self._handle_http, "127.0.0.1", self.http_port)
+            )
+        self.started_at = time.time()
+        logger.info(f"HyreLog collector listening on {self.socket_path}")
+
+    async def serve_forever(self) -> None:
+        """Run until ``stop()`` is called or SIGTERM/SIGINT is received"""
+        self._stopped = asyncio.Event()
+        await self.start()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(signum, self._stopped.set)
+            except (NotImplementedError, RuntimeError):
+                pass
+        await self._stopped.wait()
+        await self.close()
+
+    def stop(self) -> None:
+        """Ask ``serve_forever()`` to shut down"""
+        if self._stopped is not None:
+            self._stopped.set()
+
+    async def close(self) -> None:
+        """Stop accepting connections and drain the queue into the API or spool"""
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        self._servers.clear()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        await self.client.close()
+
+    def health(self) -> Dict[str, Any]:
+        """Liveness and queue summary"""
+        depth, oldest_age = self.client.metrics.queue_stats()
+        return {
+            "status": "ok",
+            "uptime": time.time() - self.started_at if self.started_at else 0.0,
+            "connections": self.connections,
+            "queueDepth": depth,
+            "oldestQueuedAge": oldest_age,
+            "spooledFiles": len(self.client.spool) if self.client.spool is not None else 0,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """Collector counters plus the delivery client's ``ClientStats``"""
+        return {
+            "eventsReceived": self.events_received,
+            "invalidLines": self.invalid_lines,
+            "client": self.client.stats().model_dump(),
+        }
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    self.invalid_lines += 1
+                    logger.warning("HyreLog collector closed a connection: line too long")
+                    return
+                if not line:
+                    return
+                line = line.strip()
+                if not line:
+                    continue
+                reply = self._handle_line(line)
+                if reply is not None:
+                    writer.write(json.dumps(reply).encode() + b"\n")
+                    await writer.drain()
+        except ConnectionError:
+            return
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    def _handle_line(self, line: bytes) -> Optional[Dict[str, Any]]:
+        try:
+            message = json.loads(line)
+            if "op" in message:
+                if message["op"] == "health":
+                    return self.health()
+                if message["op"] == "stats":
+                    return self.stats()
+                return {"error": f"Unknown op: {message['op']}"}
+            event = EventInput(**message)
+        except Exception as e:
+            self.invalid_lines += 1
+            logger.warning(f"HyreLog collector rejected a line: {e}")
+            return None
+        self.events_received += 1
+        self.client.enqueue_event(event)
+        return None
+
+    async def _handle_http(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Minimal HTTP endpoint for probes: GET /health and GET /metrics"""
+        try:
+            request_line = (await reader.readline()).decode(errors="replace").split()
+            while (await reader.readline()).strip():
+                pass
+            path = request_line[1] if len(request_line) > 1 else "/"
+            if path == "/health":
+                status, body = "200 OK", self.health()
+            elif path == "/metrics":
+                status, body = "200 OK", self.stats()
+            else:
+                status, body = "404 Not Found", {"error": "Not found"}
+            payload = json.dumps(body).encode()
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+                f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n".encode() + payload
+            )
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+class CollectorConnection:
+    """Client side of the collector socket, used by ``HyreLogWorkspaceClient``"""
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH):
+        self.socket_path = socket_path
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def _connect(self) -> asyncio.StreamWriter:
+        if self._writer is None or self._writer.is_closing():
+            self._reader, self._writer = await asyncio.open_unix_connection(self.socket_path)
+        return self._writer
+
+    async def send(self, events: List[Dict[str, Any]]) -> None:
+        """Write serialized events as NDJSON, reconnecting once if the collector restarted"""
+        payload = b"".join(
+            json.dumps(event, separators=(",", ":")).encode() + b"\n" for event in events
+        )
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            for attempt in range(2):
+                try:
+                    writer = await self._connect()
+                    writer.write(payload)
+                    await writer.drain()
+                    return
+                except (ConnectionError, FileNotFoundError):
+                    self.reset()
+                    if attempt:
+                        raise
+
+    async def request(self, op: str) -> Dict[str, Any]:
+        """Send a control request (``"health"`` or ``"stats"``) and return the reply"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            writer = await self._connect()
+            writer.write(json.dumps({"op": op}).encode() + b"\n")
+            await writer.drain()
+            assert self._reader is not None
+            return json.loads(await self._reader.readline())
+
+    def reset(self) -> None:
+        """Forget the current connection (after a fork or a write error)"""
+        if self._writer is not None and not self._writer.is_closing():
+            try:
+                self._writer.close()
+            except RuntimeError:
+                pass
+        self._reader = None
+        self._writer = None
+        self._lock = None
+
+    async def close(self) -> None:
+        """Close the socket connection"""
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+        self._reader = None
+        self._writer = None
@@ -0,0 +1,186 @@
+"""
+Compact event representations for large query and export results
+
+``CompactEvent`` is a slotted record and ``EventBatch`` stores one list per
+field; both intern repeated strings (action, category, ids of the company,
+workspace and project) and convert to the pydantic ``Event`` only on demand.
+"""
+
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from hyrelog.types import Event
+
+# Field name -> API key, in record order
+FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("id", "id"),
+    ("company_id", "companyId"),
+    ("workspace_id", "workspaceId"),
+    ("project_id", "projectId"),
+    ("action", "action"),
+    ("category", "category"),
+    ("actor_id", "actorId"),
+    ("actor_email", "actorEmail"),
+    ("actor_name", "actorName"),
+    ("target_id", "targetId"),
+    ("target_type", "targetType"),
+    ("payload", "payload"),
+    ("metadata", "metadata"),
+    ("changes", "changes"),
+    ("hash", "hash"),
+    ("prev_hash", "prevHash"),
+    ("trace_id", "traceId"),
+    ("span_id", "spanId"),
+    ("created_at", "createdAt"),
+    ("archived", "archived"),
+    ("data_region", "dataRegion"),
+)
+
+FIELD_NAMES: Tuple[str, ...] = tuple(name for name, _ in FIELDS)
+
+# Low-cardinality string fields worth sharing between records
+_INTERNED = frozenset(
+    ("company_id", "workspace_id", "project_id", "action", "category", "actor_id", "data_region")
+)
+
+# (API key, intern?, nested object, nested key) per field
+_EXTRACTORS = tuple(
+    (
+        key,
+        name in _INTERNED,
+        "actor" if name.startswith("actor_") else "target" if name.startswith("target_") else None,
+        name.split("_", 1)[1] if name.startswith(("actor_", "target_")) else None,
+    )
+    for name, key in FIELDS
+)
+
+
+def _intern(value: Any) -> Any:
+    # Exact type: sys.intern() rejects str subclasses
+    return sys.intern(value) if type(value) is str else value  # noqa: E721
+
+
+def event_row(raw: Dict[str, Any]) -> Tuple[Any, ...]:
+    """
+    Extract a field tuple from an API event dict
+
+    Accepts both the flat columns returned by query and export endpoints
+    (``actorId``, ``targetType``) and nested ``actor``/``target`` objects.
+    """
+    row = []
+    for key, intern, nested, nested_key in _EXTRACTORS:
+        if key in raw:
+            value = raw[key]
+        elif nested is not None and raw.get(nested):
+            value = raw[nested].get(nested_key)
+        else:
+            value = None
+        row.append(_intern(value) if intern else value)
+    return tuple(row)
+
+
+def _to_event(values: Dict[str, Any]) -> Event:
+    actor = None
+    if values["actor_id"] or values["actor_email"] or values["actor_name"]:
+        actor = {
+            "id": values["actor_id"],
+            "email": values["actor_email"],
+            "name": values["actor_name"],
+        }
+    target = None
+    if values["target_id"] or values["target_type"]:
+        target = {"id": values["target_id"], "type": values["target_type"]}
+    return Event(
+        id=values["id"],
+        company_id=values["company_id"],
+        workspace_id=values["workspace_id"],
+        project_id=values["project_id"],
+        action=values["action"],
+        category=values["category"],
+        actor=actor,
+        target=target,
+        payload=values["payload"],
+        metadata=values["metadata"],
+        changes=values["changes"],
+        hash=values["hash"],
+        prev_hash=values["prev_hash"],
+        trace_id=values["trace_id"],
+        span_id=values["span_id"],
+        created_at=values["created_at"],
+        archived=bool(values["archived"]),
+        data_region=values["data_region"],
+    )
+
+
+class CompactEvent:
+    """Slotted event record; use ``to_event()`` for the pydantic model"""
+
+    __slots__ = FIELD_NAMES
+
+    def __init__(self, *values: Any):
+        for name, value in zip(FIELD_NAMES, values):
+            setattr(self, name, value)
+
+    @classmethod
+    def from_api(cls, raw: Dict[str, Any]) -> "CompactEvent":
+        """Build a record from an API event dict"""
+        return cls(*event_row(raw))
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Field values keyed by snake_case name"""
+        return {name: getattr(self, name) for name in FIELD_NAMES}
+
+    def to_event(self) -> Event:
+        """Convert to the pydantic ``Event`` model"""
+        return _to_event(self.as_dict())
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactEvent(id={self.id!r}, action={self.action!r}, "
+            f"created_at={self.created_at!r})"
+        )
+
+
+class EventBatch:
+    """Columnar batch of events: one list per field, indexed by row"""
+
+    __slots__ = ("columns", "_length")
+
+    def __init__(self, columns: Dict[str, List[Any]]):
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All EventBatch columns must have the same length")
+        self.columns = columns
+        self._length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_api(cls, events: Iterable[Dict[str, Any]]) -> "EventBatch":
+        """Build a batch from API event dicts"""
+        rows = [event_row(raw) for raw in events]
+        if not rows:
+            return cls({name: [] for name in FIELD_NAMES})
+        return cls({name: list(values) for name, values in zip(FIELD_NAMES, zip(*rows))})
+
+    def __len__(self) -> int:
+        return self._length
+
+    def column(self, name: str) -> List[Any]:
+        """All values of one field"""
+        return self.columns[name]
+
+    def row(self, index: int) -> CompactEvent:
+        """One row as a ``CompactEvent``"""
+        return CompactEvent(*(self.columns[name][index] for name in FIELD_NAMES))
+
+    def __iter__(self) -> Iterator[CompactEvent]:
+        for index in range(self._length):
+            yield self.row(index)
+
+    def to_events(self, indices: Optional[Iterable[int]] = None) -> List[Event]:
+        """Convert all rows (or the given rows) to pydantic ``Event`` models"""
+        if indices is None:
+            indices = range(self._length)
+        return [
+            _to_event({name: self.columns[name][index] for name in FIELD_NAMES})
+            for index in indices
+        ]
@@ -0,0 +1,518 @@
+"""
+Bulk import of NDJSON or CSV files (``python -m hyrelog import``)
+
+The file is memory-mapped and cut into chunks at line boundaries. A
+process pool parses, validates and serializes each chunk into ready-to-send
+batch bodies, so the event loop only uploads bytes. Batches are uploaded
+concurrently, paced by the ``X-RateLimit-*`` response headers. Each carries
+a deterministic ``Idempotency-Key``. Completed batches are recorded in a
+checkpoint file so an interrupted import resumes where it stopped.
+
+A gzip stream cannot be split, so gzip files are decompressed in the main
+process and workers receive chunk bytes instead of offsets. CSV records
+must not contain raw newlines inside quoted fields.
+"""
+
+import asyncio
+import csv
+import gzip
+import hashlib
+import io
+import json
+import mmap
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from hyrelog.client.base import logger
+from hyrelog.types import EventInput, ImportResult
+
+if TYPE_CHECKING:
+    import httpx
+
+    from hyrelog.client.workspace import HyreLogWorkspaceClient
+
+BATCH_PATH = "/v1/key/workspace/events/batch"
+
+# CSV columns holding JSON documents rather than plain strings
+JSON_COLUMNS = {"payload", "metadata", "changes"}
+
+# Status codes meaning the server refused the batch itself; it is written to
+# the rejects file instead of aborting the import
+REJECTED_STATUS_CODES = {400, 413, 422}
+
+CHECKPOINT_VERSION = 1
+
+
+class Chunk(NamedTuple):
+    """A run of whole lines: byte offsets, plus the bytes for gzip input"""
+
+    start: int
+    end: int
+    data: Optional[bytes]
+
+
+class ParsedChunk(NamedTuple):
+    """Worker output for one chunk"""
+
+    start: int
+    batches: List[Tuple[int, bytes]]  # (event count, request body)
+    invalid: List[Tuple[int, str, str]]  # (byte offset, error, line)
+
+
+def detect_format(path: str) -> str:
+    """``ndjson`` or ``csv`` from the file extension (``.gz`` is ignored)"""
+    name = path[:-3] if path.endswith(".gz") else path
+    extension = os.path.splitext(name)[1].lower()
+    if extension in (".ndjson", ".jsonl", ".json"):
+        return "ndjson"
+    if extension == ".csv":
+        return "csv"
+    raise ValueError(f"Cannot tell the format of {path}; pass format='ndjson' or 'csv'")
+
+
+def _csv_record(header: List[str], row: List[str]) -> Dict[str, Any]:
+    """A CSV row as EventInput fields; dotted columns (``actor.id``) nest"""
+    record: Dict[str, Any] = {}
+    for column, value in zip(header, row):
+        if value == "":
+            continue
+        if column in JSON_COLUMNS:
+            record[column] = json.loads(value)
+        elif "." in column:
+            outer, inner = column.split(".", 1)
+            record.setdefault(outer, {})[inner] = value
+        else:
+            record[column] = value
+    return record
+
+
+def _describe(error: Exception) -> str:
+    errors = getattr(error, "errors", None)
+    if callable(errors):
+        return "; ".join(
+            f"{'.'.join(str(part) for part in e['loc'])}: {e['msg']}" for e in errors()
+        )
+    return str(error)
+
+
+def parse_chunk(
+    path: str,
+    fmt: str,
+    header: Optional[List[str]],
+    batch_size: int,
+    chunk: Chunk,
+) -> ParsedChunk:
+    """
+    Parse and validate one chunk into serialized batch bodies
+
+    Runs in a worker process. Uncompressed chunks are read from the worker's
+    own mapping of the file, so only offsets cross the process boundary.
+    """
+    data = chunk.data
+    if data is None:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            data = mapped[chunk.start : chunk.end]
+
+    # (offset, line) for every non-blank line
+    lines: List[Tuple[int, bytes]] = []
+    offset = chunk.start
+    for line in data.split(b"\n"):
+        if line.strip():
+            lines.append((offset, line))
+        offset += len(line) + 1
+
+    events: List[bytes] = []
+    invalid: List[Tuple[int, str, str]] = []
+    for offset, line in lines:
+        try:
+            if fmt == "csv":
+                assert header is not None
+                row = next(csv.reader([line.decode("utf-8")]))
+                event = EventInput.model_validate(_csv_record(header, row))
+            else:
+                event = EventInput.model_validate_json(line)
+        except Exception as e:
+            invalid.append((offset, _describe(e), line.decode("utf-8", "replace")))
+            continue
+        events.append(event.model_dump_json(by_alias=True, exclude_none=True).encode())
+
+    batches = [
+        (len(group), b'{"events":[' + b",".join(group) + b"]}")
+        for group in (events[i : i + batch_size] for i in range(0, len(events), batch_size))
+    ]
+    return ParsedChunk(chunk.start, batches, invalid)
+
+
+def _chunks(mapped: "mmap.mmap", start: int, chunk_bytes: int) -> Iterator[Chunk]:
+    """Offsets of line-aligned chunks of an uncompressed mapping"""
+    size = len(mapped)
+    while start < size:
+        end = mapped.find(b"\n", min(start + chunk_bytes, size))
+        end = size if end == -1 else end + 1
+        yield Chunk(start, end, None)
+        start = end
+
+
+def _gzip_chunks(stream: "gzip.GzipFile", start: int, chunk_bytes: int) -> Iterator[Chunk]:
+    """Line-aligned chunks of a decompressed stream, offsets in decompressed bytes"""
+    while True:
+        data = stream.read(chunk_bytes)
+        if not data:
+            return
+        if not data.endswith(b"\n"):
+            data += stream.readline()
+        yield Chunk(start, start + len(data), data)
+        start += len(data)
+
+
+class RatePacer:
+    """
+    Spreads requests over what remains of the rate limit window
+
+    Fed by the ``X-RateLimit-Remaining`` and ``X-RateLimit-Reset`` headers
+    of every response; until those are seen, requests are not delayed.
+    """
+
+    def __init__(self) -> None:
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        self._next_at = 0.0
+
+    async def observe(self, response: "httpx.Response") -> None:
+        """httpx response hook"""
+        remaining = response.headers.get("x-ratelimit-remaining")
+        reset = response.headers.get("x-ratelimit-reset")
+        if remaining is None or reset is None:
+            return
+        try:
+            reset_wall = datetime.fromisoformat(reset.replace("Z", "+00:00")).timestamp()
+            self.remaining = int(remaining)
+        except ValueError:
+            return
+        self.reset_at = time.monotonic() + max(reset_wall - time.time(), 0.0)
+
+    async def wait(self) -> None:
+        """Delay until this request's slot in the current window"""
+        if self.remaining is None or self.reset_at is None:
+            return
+        now = time.monotonic()
+        if self.reset_at <= now:
+            return
+        if self.remaining <= 0:
+            await asyncio.sleep(self.reset_at - now)
+            return
+        # Slots are spaced evenly over what is left of the window
+        slot = max(self._next_at, now)
+        self._next_at = slot + max(self.reset_at - slot, 0.0) / self.remaining
+        self.remaining -= 1
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class _Checkpoint:
+    """Completed batches per chunk, persisted atomically as JSON"""
+
+    def __init__(self, path: Optional[str], identity: Dict[str, Any]):
+        self.path = path
+        self.identity = identity
+        # chunk start -> indexes of uploaded batches, until the chunk completes
+        self.partial: Dict[int, Set[int]] = {}
+        # chunk start -> events in the chunk, once every batch is uploaded
+        self.complete: Dict[int, int] = {}
+        self.totals: Dict[int, Tuple[int, int]] = {}  # start -> (batches, events)
+        self.saved_at = 0.0
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                state = json.load(f)
+            if state.get("identity") != identity:
+                raise ValueError(
+                    f"Checkpoint {path} was written for a different file or settings; "
+                    "delete it to start over"
+                )
+            self.partial = {int(k): set(v) for k, v in state.get("partial", {}).items()}
+            self.complete = {int(k): v for k, v in state.get("complete", {}).items()}
+
+    def parsed(self, start: int, batches: List[Tuple[int, bytes]]) -> None:
+        self.totals[start] = (len(batches), sum(count for count, _ in batches))
+        self._settle(start)
+
+    def done(self, start: int, index: int) -> None:
+        self.partial.setdefault(start, set()).add(index)
+        self._settle(start)
+
+    def _settle(self, start: int) -> None:
+        total = self.totals.get(start)
+        if total is not None and len(self.partial.get(start, ())) >= total[0]:
+            self.partial.pop(start, None)
+            self.complete[start] = total[1]
+
+    def save(self, force: bool = False) -> None:
+        """Write the checkpoint, at most once a second unless forced"""
+        now = time.monotonic()
+        if not self.path or (not force and now - self.saved_at < 1.0):
+            return
+        self.saved_at = now
+        state = {
+            "version": CHECKPOINT_VERSION,
+            "identity": self.identity,
+            "partial": {str(k): sorted(v) for k, v in self.partial.items()},
+            "complete": {str(k): v for k, v in self.complete.items()},
+        }
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, self.path)
+
+
+class BulkImporter:
+    """
+    Import an NDJSON or CSV file (optionally gzipped) into a workspace
+
+    ``checkpoint`` defaults to ``<path>.checkpoint``; pass ``None`` together
+    with ``resume=False`` to run without one. Events failing validation and
+    batches the server rejects are appended to ``rejects`` if given.
+    """
+
+    def __init__(
+        self,
+        client: "HyreLogWorkspaceClient",
+        path: str,
+        format: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        chunk_bytes: int = 4 * 1024 * 1024,
+        workers: Optional[int] = None,
+        concurrency: int = 8,
+        checkpoint: Optional[str] = "",
+        rejects: Optional[str] = None,
+        progress_interval: float = 5.0,
+        resume: bool = True,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.client = client
+        self.path = path
+        self.format = format or detect_format(path)
+        if self.format not in ("ndjson", "csv"):
+            raise ValueError(f"Unsupported format: {self.format}")
+        self.batch_size = batch_size or client.max_batch_size
+        self.chunk_bytes = chunk_bytes
+        self.workers = workers or os.cpu_count() or 1
+        self.concurrency = concurrency
+        self.checkpoint_path = f"{path}.checkpoint" if checkpoint == "" else checkpoint
+        self.rejects_path = rejects
+        self.progress_interval = progress_interval
+        self.resume = resume
+        self.pacer = RatePacer()
+
+        self.events_sent = 0
+        self.events_invalid = 0
+        self.events_rejected = 0
+        self.events_skipped = 0
+        self.batches = 0
+        self.bytes_read = 0
+
+    def _idempotency_key(self, start: int, index: int) -> str:
+        identity = self._checkpoint.identity
+        seed = f"{identity['file']}:{identity['size']}:{identity['mtime_ns']}:{start}:{index}"
+        return hashlib.sha256(seed.encode()).hexdigest()[:32]
+
+    async def run(self) -> ImportResult:
+        """Import the file; resumes from the checkpoint if one matches"""
+        started = time.perf_counter()
+        stat = os.stat(self.path)
+        identity = {
+            "file": os.path.abspath(self.path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "format": self.format,
+            "chunk_bytes": self.chunk_bytes,
+            "batch_size": self.batch_size,
+        }
+        if not self.resume and self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+        self._checkpoint = _Checkpoint(self.checkpoint_path, identity)
+        rejects = open(self.rejects_path, "a", encoding="utf-8") if self.rejects_path else None
+
+        self.client.client.event_hooks["response"].append(self.pacer.observe)
+        complete = False
+        try:
+            if stat.st_size:
+                with open(self.path, "rb") as f, mmap.mmap(
+                    f.fileno(), 0, access=mmap.ACCESS_READ
+                ) as mapped:
+                    await self._import(mapped, rejects)
+            complete = True
+        finally:
+            self.client.client.event_hooks["response"].remove(self.pacer.observe)
+            self._checkpoint.save(force=True)
+            if rejects is not None:
+                rejects.close()
+
+        duration = time.perf_counter() - started
+        if complete and self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+        result = ImportResult(
+            events_sent=self.events_sent,
+            events_invalid=self.events_invalid,
+            events_rejected=self.events_rejected,
+            events_skipped=self.events_skipped,
+            batches=self.batches,
+            bytes_read=self.bytes_read,
+            duration_ms=duration * 1000,
+            events_per_second=self.events_sent / duration if duration else 0.0,
+            complete=complete,
+        )
+        logger.info(self._progress_line(duration, final=True))
+        return result
+
+    async def _import(self, mapped: "mmap.mmap", rejects: Optional[io.TextIOBase]) -> None:
+        loop = asyncio.get_running_loop()
+        header: Optional[List[str]] = None
+        compressed = mapped[:2] == b"\x1f\x8b"
+        stream: Optional[gzip.GzipFile] = None
+        if compressed:
+            stream = gzip.GzipFile(fileobj=mapped)  # type: ignore[arg-type]
+            first = stream.readline() if self.format == "csv" else b""
+        else:
+            first = mapped.readline() if self.format == "csv" else b""
+        if self.format == "csv":
+            header = next(csv.reader([first.decode("utf-8-sig").rstrip("\r\n")]))
+        chunks = (
+            _gzip_chunks(stream, len(first), self.chunk_bytes)
+            if stream is not None
+            else _chunks(mapped, len(first), self.chunk_bytes)
+        )
+
+        queue: "asyncio.Queue[Optional[Tuple[int, int, int, bytes]]]" = asyncio.Queue(
+            maxsize=self.concurrency * 4
+        )
+        # Bounds chunks being parsed or waiting to be queued, and so memory
+        parse_slots = asyncio.Semaphore(self.workers * 2)
+        parsing: Set[asyncio.Task] = set()
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+
+            async def parse(chunk: Chunk) -> None:
+                try:
+                    parsed = await loop.run_in_executor(
+                        pool, parse_chunk, self.path, self.format, header, self.batch_size, chunk
+                    )
+                    self._record_invalid(parsed.invalid, rejects)
+                    self._checkpoint.parsed(parsed.start, parsed.batches)
+                    done = self._checkpoint.partial.get(parsed.start, set())
+                    for index, (count, body) in enumerate(parsed.batches):
+                        if index in done:
+                            self.events_skipped += count
+                        else:
+                            await queue.put((parsed.start, index, count, body))
+                finally:
+                    parse_slots.release()
+
+            async def produce() -> None:
+                # Decompression and scanning for newlines happen off the loop
+                while True:
+                    await parse_slots.acquire()
+                    chunk = await loop.run_in_executor(None, next, chunks, None)
+                    if chunk is None:
+                        parse_slots.release()
+                        break
+                    self.bytes_read = chunk.end
+                    if chunk.start in self._checkpoint.complete:
+                        self.events_skipped += self._checkpoint.complete[chunk.start]
+                        parse_slots.release()
+                        continue
+                    task = asyncio.ensure_future(parse(chunk))
+                    parsing.add(task)
+                    task.add_done_callback(parsing.discard)
+                if parsing:
+                    await asyncio.gather(*parsing)
+                for _ in range(self.concurrency):
+                    await queue.put(None)
+
+            uploaders = [
+                asyncio.ensure_future(self._upload(queue, rejects)) for _ in range(self.concurrency)
+            ]
+            producer = asyncio.ensure_future(produce())
+            progress = asyncio.ensure_future(self._report_progress())
+            try:
+                # The first failure (parse or upload) stops everything
+                await asyncio.gather(producer, *uploaders)
+            finally:
+                for task in [producer, progress, *uploaders, *parsing]:
+                    task.cancel()
+                await asyncio.gather(
+                    producer, progress, *uploaders, *parsing, return_exceptions=True
+                )
+
+    async def _upload(
+        self,
+        queue: "asyncio.Queue[Optional[Tuple[int, int, int, bytes]]]",
+        rejects: Optional[io.TextIOBase],
+    ) -> None:
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            start, index, count, body = item
+            await self.pacer.wait()
+            try:
+                await self.client._request(
+                    "POST",
+                    BATCH_PATH,
+                    body=body,
+                    headers={"idempotency-key": self._idempotency_key(start, index)},
+                )
+            except Exception as e:
+                if getattr(e, "status_code", None) not in REJECTED_STATUS_CODES:
+                    raise
+                self.events_rejected += count
+                if rejects is not None:
+                    for event in json.loads(body)["events"]:
+                        rejects.write(json.dumps({"error": str(e), "event": event}) + "\n")
+            else:
+                self.events_sent += count
+                self.client.metrics.record_batch(count)
+            self.batches += 1
+            self._checkpoint.done(start, index)
+            self._checkpoint.save()
+
+    def _record_invalid(
+        self, invalid: List[Tuple[int, str, str]], rejects: Optional[io.TextIOBase]
+    ) -> None:
+        self.events_invalid += len(invalid)
+        if rejects is None:
+            return
+        for offset, error, line in invalid:
+            rejects.write(json.dumps({"offset": offset, "error": error, "line": line}) + "\n")
+
+    def _progress_line(self, elapsed: float, final: bool = False) -> str:
+        rate = self.events_sent / elapsed if elapsed else 0.0
+        stats = self.client.stats()
+        return (
+            f"{'Imported' if final else 'Importing'}: {self.events_sent} events sent "
+            f"({rate:,.0f}/s, {self.bytes_read / elapsed / 1e6 if elapsed else 0:.1f} MB/s read), "
+            f"{self.events_invalid} invalid, {self.events_rejected} rejected, "
+            f"{self.events_skipped} already imported, {stats.retries} retries, "
+            f"{stats.rate_limited} rate limited"
+        )
+
+    async def _report_progress(self) -> None:
+        started = time.perf_counter()
+        while True:
+            await asyncio.sleep(self.progress_interval)
+            logger.info(self._progress_line(time.perf_counter() - started))
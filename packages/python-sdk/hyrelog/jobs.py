@@ -0,0 +1,350 @@
+"""
+Handles for asynchronous server-side jobs (GDPR exports)
+
+``JobHandle.wait()`` polls one job with adaptive backoff: the interval
+grows while the status is unchanged and resets when it moves (e.g. from
+PENDING to PROCESSING). ``JobScheduler`` drives many jobs from a single
+task, polling only the ones that are due. Finished exports are streamed
+to disk or an iterator without buffering the body.
+"""
+
+import asyncio
+import heapq
+import itertools
+import os
+import random
+import time
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from hyrelog.client.base import logger
+from hyrelog.types import Job
+
+if TYPE_CHECKING:
+    import httpx
+
+    from hyrelog.client.base import BaseClient
+
+JOBS_PATH = "/v1/key/company/jobs"
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+class JobError(Exception):
+    """A finished job's result cannot be retrieved"""
+
+    def __init__(self, job_id: str, message: str):
+        super().__init__(message)
+        self.job_id = job_id
+
+
+class JobFailedError(JobError):
+    """The job finished with status FAILED; ``error`` is the server's reason"""
+
+    def __init__(self, job_id: str, error: Optional[str]):
+        super().__init__(job_id, f"Job {job_id} failed: {error}")
+        self.error = error
+
+
+class JobResultUnavailableError(JobError):
+    """The job completed but its result has no ``downloadUrl``"""
+
+
+class JobDownloadError(JobError):
+    """Downloading the result returned an HTTP error"""
+
+    def __init__(self, job_id: str, status_code: int, body: str):
+        super().__init__(job_id, f"HyreLog job download error: {status_code} {body}")
+        self.status_code = status_code
+
+
+def _origin(url: str) -> Optional[Tuple[str, str, int]]:
+    """(scheme, host, port) of an absolute URL, or None if it cannot be parsed"""
+    try:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        port = parts.port or _DEFAULT_PORTS.get(scheme)
+    except ValueError:
+        return None
+    if not parts.hostname or port is None:
+        return None
+    return scheme, parts.hostname, port
+
+
+class _PollSchedule:
+    """Backoff between polls of one job, reset whenever its status changes"""
+
+    def __init__(self, initial: float, maximum: float, multiplier: float = 1.5):
+        if initial <= 0 or maximum < initial:
+            raise ValueError("Poll intervals must satisfy 0 < initial_interval <= max_interval")
+        self.initial = initial
+        self.maximum = maximum
+        self.multiplier = multiplier
+        self.interval = initial
+        self.status: Optional[str] = None
+
+    def next(self, status: str) -> float:
+        """Seconds until the next poll after observing ``status``"""
+        if status != self.status:
+            self.status = status
+            self.interval = self.initial
+        else:
+            self.interval = min(self.interval * self.multiplier, self.maximum)
+        # Jitter keeps many jobs created together from polling in lockstep
+        return self.interval * random.uniform(0.9, 1.1)
+
+
+class JobHandle:
+    """A job on the server, polled on demand"""
+
+    def __init__(self, client: "BaseClient", job_id: str, job: Optional[Job] = None):
+        self.client = client
+        self.id = job_id
+        self.job = job
+
+    def __repr__(self) -> str:
+        status = self.job.status if self.job else "unknown"
+        return f"<JobHandle {self.id} {status}>"
+
+    @property
+    def done(self) -> bool:
+        """Whether the last observed status is final"""
+        return self.job is not None and self.job.done
+
+    async def refresh(self) -> Job:
+        """Fetch the current state of the job"""
+        result = await self.client._request("GET", f"{JOBS_PATH}/{self.id}")
+        self.job = Job(**result)
+        return self.job
+
+    async def wait(
+        self,
+        timeout: Optional[float] = None,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> Job:
+        """
+        Poll until the job completes or fails and return its final state
+
+        Raises ``TimeoutError`` if it is still running after ``timeout``
+        seconds. A failed job is returned, not raised; check ``status``.
+        """
+        schedule = _PollSchedule(initial_interval, max_interval)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            job = await self.refresh()
+            if job.done:
+                return job
+            delay = schedule.next(job.status)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"Job {self.id} still {job.status} after {timeout}s")
+                delay = min(delay, remaining)
+            await asyncio.sleep(delay)
+
+    @property
+    def download_url(self) -> Optional[str]:
+        """Where the finished export can be downloaded, if the server provided it"""
+        if self.job is None or self.job.result is None:
+            return None
+        return self.job.result.get("downloadUrl")
+
+    def _ready_url(self) -> str:
+        if self.job is None or not self.job.done:
+            raise ValueError(f"Job {self.id} has not finished; await wait() first")
+        if self.job.status == "FAILED":
+            raise JobFailedError(self.id, self.job.error)
+        url = self.download_url
+        if not url:
+            raise JobResultUnavailableError(
+                self.id, f"Job {self.id} completed without a downloadUrl"
+            )
+        return url
+
+    async def stream(self, chunk_size: int = 65536) -> AsyncIterator[bytes]:
+        """
+        Yield the export body in chunks as it downloads
+
+        Raises ``JobFailedError``, ``JobResultUnavailableError`` (no
+        ``downloadUrl`` in the result) or ``JobDownloadError``.
+        """
+        import httpx
+
+        url = self._ready_url()
+        if url.startswith("/"):
+            url = f"{self.client.base_url}{url}"
+        # Only the API's own origin (scheme, host and port) may receive the
+        # API key; pre-signed storage URLs and anything else get a bare client
+        origin = _origin(url)
+        own = origin is not None and origin == _origin(self.client.base_url)
+        http = self.client.client if own else httpx.AsyncClient(timeout=self.client.timeout)
+
+        with self.client.tracing.span(
+            "hyrelog.job.download", attributes={"http.url": url, "hyrelog.job_id": self.id}
+        ):
+            started = time.perf_counter()
+            try:
+                async with http.stream("GET", url) as response:
+                    if response.status_code >= 400:
+                        await response.aread()
+                        raise JobDownloadError(self.id, response.status_code, response.text)
+                    async for chunk in response.aiter_bytes(chunk_size):
+                        yield chunk
+                    self._record(response, started)
+            finally:
+                if not own:
+                    await http.aclose()
+
+    def _record(self, response: "httpx.Response", started: float) -> None:
+        self.client.metrics.record_request(
+            "GET",
+            response.status_code,
+            (time.perf_counter() - started) * 1000,
+            0,
+            response.num_bytes_downloaded,
+        )
+
+    async def save(self, path: str, chunk_size: int = 65536) -> int:
+        """
+        Stream the export to ``path`` and return the number of bytes written
+
+        The file is written under a temporary name and renamed when complete,
+        so ``path`` never holds a partial download.
+        """
+        temporary = f"{path}.part"
+        written = 0
+        try:
+            with open(temporary, "wb") as f:
+                async for chunk in self.stream(chunk_size):
+                    f.write(chunk)
+                    written += len(chunk)
+                f.flush()
+                os.fsync(f.fileno())
+        except BaseException:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+        os.replace(temporary, path)
+        return written
+
+
+class _Tracked:
+    """A job the scheduler is waiting on"""
+
+    __slots__ = ("handle", "future", "schedule")
+
+    def __init__(self, handle: JobHandle, future: "asyncio.Future[Job]", schedule: _PollSchedule):
+        self.handle = handle
+        self.future = future
+        self.schedule = schedule
+
+
+class JobScheduler:
+    """
+    Waits on many jobs from one task
+
+    Jobs are kept in a heap by next poll time, so each poll is a single
+    request for a job that is due, with at most ``max_concurrency`` polls
+    in flight.
+    """
+
+    def __init__(
+        self,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        max_concurrency: int = 8,
+    ):
+        # Validates the intervals up front
+        _PollSchedule(initial_interval, max_interval)
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.max_concurrency = max_concurrency
+        # (next poll, tie-breaker, entry) where an entry is one tracked job
+        self._heap: List[Tuple[float, int, "_Tracked"]] = []
+        self._order = itertools.count()
+        self._futures: Dict[str, "asyncio.Future[Job]"] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def add(self, handle: JobHandle) -> "asyncio.Future[Job]":
+        """Start tracking a job; the future resolves with its final state"""
+        future = self._futures.get(handle.id)
+        if future is not None and not future.done():
+            return future
+        future = asyncio.get_running_loop().create_future()
+        self._futures[handle.id] = future
+        entry = _Tracked(handle, future, _PollSchedule(self.initial_interval, self.max_interval))
+        heapq.heappush(self._heap, (time.monotonic(), next(self._order), entry))
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        self._wakeup.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+        return future
+
+    async def wait(
+        self, handles: Iterable[JobHandle], timeout: Optional[float] = None
+    ) -> List[Job]:
+        """Final state of every job, in the order given"""
+        futures = [self.add(handle) for handle in handles]
+        return list(await asyncio.wait_for(asyncio.gather(*futures), timeout))
+
+    async def as_completed(self, handles: Iterable[JobHandle]) -> AsyncIterator[Job]:
+        """Yield each job's final state as soon as it is reached"""
+        for future in asyncio.as_completed([self.add(handle) for handle in handles]):
+            yield await future
+
+    async def _run(self) -> None:
+        assert self._wakeup is not None
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        while self._heap:
+            self._wakeup.clear()
+            due_at = self._heap[0][0]
+            delay = due_at - time.monotonic()
+            if delay > 0:
+                try:
+                    # A newly added job may be due sooner than the current head
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            now = time.monotonic()
+            due: List[_Tracked] = []
+            while self._heap and self._heap[0][0] <= now:
+                due.append(heapq.heappop(self._heap)[2])
+            await asyncio.gather(*(self._poll(entry, semaphore) for entry in due))
+
+    async def _poll(self, entry: "_Tracked", semaphore: asyncio.Semaphore) -> None:
+        # A done future here means the caller gave up (e.g. wait() timed out)
+        if not entry.future.done():
+            try:
+                async with semaphore:
+                    job = await entry.handle.refresh()
+            except Exception as e:
+                logger.warning(f"Polling job {entry.handle.id} failed: {e}")
+                entry.future.set_exception(e)
+            else:
+                if job.done:
+                    entry.future.set_result(job)
+                else:
+                    delay = entry.schedule.next(job.status)
+                    heapq.heappush(self._heap, (time.monotonic() + delay, next(self._order), entry))
+                    return
+        if self._futures.get(entry.handle.id) is entry.future:
+            del self._futures[entry.handle.id]
+
+    async def close(self) -> None:
+        """Stop polling; unfinished waits are cancelled"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+        self._heap.clear()
@@ -0,0 +1,74 @@
+"""
+Process lifecycle hooks shared by every client
+
+Clients register themselves here so that, once per process, a child
+created by ``os.fork()`` can reset inherited connections, queues and
+timers, and queued events can be drained when the interpreter exits.
+"""
+
+import atexit
+import os
+import signal
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, Iterable
+
+if TYPE_CHECKING:
+    from hyrelog.client.base import BaseClient
+
+_clients: "weakref.WeakSet[BaseClient]" = weakref.WeakSet()
+_installed = False
+
+
+def track(client: "BaseClient") -> None:
+    """Register a client for fork and exit handling"""
+    global _installed
+    _clients.add(client)
+    if _installed:
+        return
+    _installed = True
+    if hasattr(os, "register_at_fork"):
+        os.register_at_fork(after_in_child=_after_fork_in_child)
+    # A plain atexit hook runs after threading has shut down, when the event
+    # loop's default executor (which resolves hostnames) refuses work. Hooks
+    # registered here run before that, in reverse order, so the executor
+    # module is imported first to make its own shutdown hook run after ours.
+    import concurrent.futures.thread  # noqa: F401
+
+    try:
+        threading._register_atexit(_drain_at_exit)  # type: ignore[attr-defined]
+    except (AttributeError, RuntimeError):
+        atexit.register(_drain_at_exit)
+
+
+def _after_fork_in_child() -> None:
+    for client in list(_clients):
+        client._after_fork()
+
+
+def _drain_at_exit() -> None:
+    for client in list(_clients):
+        try:
+            client._drain_at_exit()
+        except Exception as e:
+            from hyrelog.client.base import logger
+
+            logger.error(f"HyreLog exit drain failed: {e}")
+
+
+def _exit_on_signal(signum: int, frame: Any) -> None:
+    raise SystemExit(128 + signum)
+
+
+def install_signal_handlers(signals: Iterable[int] = (signal.SIGTERM,)) -> None:
+    """
+    Turn termination signals into ``SystemExit`` so the exit drain runs
+
+    A process killed by an unhandled SIGTERM skips ``atexit``; raising
+    ``SystemExit`` instead unwinds ``asyncio.run()`` and then drains every
+    client. Signals that already have a handler are left alone. Must be
+    called from the main thread.
+    """
+    for signum in signals:
+        if signal.getsignal(signum) in (signal.SIG_DFL, None):
+            signal.signal(signum, _exit_on_signal)
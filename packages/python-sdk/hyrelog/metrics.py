@@ -0,0 +1,330 @@
+"""
+SDK metrics: OpenTelemetry instruments plus an in-process stats snapshot
+
+Instruments (including the queue gauges) are registered when the first
+request is recorded, so OpenTelemetry is not imported before then.
+"""
+
+import time
+import weakref
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple
+
+from hyrelog.types import ClientStats, HistogramSnapshot
+
+if TYPE_CHECKING:
+    from opentelemetry import metrics
+
+# Histogram bucket upper bounds
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+BATCH_SIZE_BUCKETS: Tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+QueueProbe = Callable[[], Tuple[int, Optional[float]]]
+
+# Queue probes of live clients, read by the observable gauge callbacks
+_queue_probes: "weakref.WeakSet[ClientMetrics]" = weakref.WeakSet()
+
+
+class Histogram:
+    """Fixed-bucket histogram kept in process memory"""
+
+    __slots__ = ("bounds", "counts", "count", "total", "min", "max")
+
+    def __init__(self, bounds: Iterable[float]):
+        self.bounds = tuple(bounds)
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def record(self, value: float) -> None:
+        """Record a single observation"""
+        index = len(self.bounds)
+        for i, bound in enumerate(self.bounds):
+            if value <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Estimated ``q`` quantile (0-1), or None with no observations
+
+        Returns the upper bound of the bucket containing the quantile,
+        capped at the largest observation.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for bound, count in zip(self.bounds, self.counts):
+            cumulative += count
+            if cumulative >= rank:
+                return min(bound, self.max) if self.max is not None else bound
+        return self.max
+
+    def snapshot(self) -> HistogramSnapshot:
+        """Return a point-in-time copy of the histogram"""
+        labels = [f"le_{bound:g}" for bound in self.bounds] + ["inf"]
+        return HistogramSnapshot(
+            count=self.count,
+            sum=self.total,
+            min=self.min,
+            max=self.max,
+            buckets=dict(zip(labels, self.counts)),
+        )
+
+
+class _Instruments:
+    """OpenTelemetry instruments shared by every client in the process"""
+
+    def __init__(self) -> None:
+        from opentelemetry import metrics
+
+        meter = metrics.get_meter("hyrelog-sdk")
+        self.requests = meter.create_counter(
+            "hyrelog.client.requests", unit="1", description="HTTP requests sent to HyreLog"
+        )
+        self.request_duration = meter.create_histogram(
+            "hyrelog.client.request.duration", unit="ms", description="HTTP request latency"
+        )
+        self.retries = meter.create_counter(
+            "hyrelog.client.retries", unit="1", description="Retried HTTP requests"
+        )
+        self.hedged = meter.create_counter(
+            "hyrelog.client.hedged_requests", unit="1", description="Hedged GET requests sent"
+        )
+        self.region_failovers = meter.create_counter(
+            "hyrelog.client.region_failovers",
+            unit="1",
+            description="Batch ingestion moved to another region",
+        )
+        self.rate_limited = meter.create_counter(
+            "hyrelog.client.rate_limited", unit="1", description="429 responses received"
+        )
+        self.deadline_exceeded = meter.create_counter(
+            "hyrelog.client.deadline_exceeded",
+            unit="1",
+            description="Requests abandoned at their deadline",
+        )
+        self.bytes_sent = meter.create_counter(
+            "hyrelog.client.bytes_sent", unit="By", description="Request body bytes sent"
+        )
+        self.batch_size = meter.create_histogram(
+            "hyrelog.client.batch.size", unit="1", description="Events per batch request"
+        )
+        self.events_dropped = meter.create_counter(
+            "hyrelog.client.events.dropped", unit="1", description="Queued events that were lost"
+        )
+        self.events_quarantined = meter.create_counter(
+            "hyrelog.client.events.quarantined",
+            unit="1",
+            description="Events held back by schema validation",
+        )
+        self.events_shed = meter.create_counter(
+            "hyrelog.client.events.shed",
+            unit="1",
+            description="Events discarded by lane sampling or overflow",
+        )
+        self.events_sampled_out = meter.create_counter(
+            "hyrelog.client.events.sampled_out",
+            unit="1",
+            description="Events discarded by the processor pipeline's sampler",
+        )
+        meter.create_observable_gauge(
+            "hyrelog.client.queue.depth",
+            callbacks=[_observe_queue_depth],
+            unit="1",
+            description="Events waiting in batch queues",
+        )
+        meter.create_observable_gauge(
+            "hyrelog.client.queue.oldest_age",
+            callbacks=[_observe_oldest_age],
+            unit="s",
+            description="Age of the oldest queued event",
+        )
+
+
+def _observe_queue_depth(options: "metrics.CallbackOptions") -> Iterable["metrics.Observation"]:
+    from opentelemetry.metrics import Observation
+
+    depth = sum(m.queue_stats()[0] for m in list(_queue_probes))
+    return [Observation(depth)]
+
+
+def _observe_oldest_age(options: "metrics.CallbackOptions") -> Iterable["metrics.Observation"]:
+    from opentelemetry.metrics import Observation
+
+    ages = [age for _, age in (m.queue_stats() for m in list(_queue_probes)) if age is not None]
+    return [Observation(max(ages) if ages else 0.0)]
+
+
+_instruments: Optional[_Instruments] = None
+
+
+def _get_instruments() -> _Instruments:
+    global _instruments
+    if _instruments is None:
+        _instruments = _Instruments()
+    return _instruments
+
+
+class ClientMetrics:
+    """Per-client counters mirrored to OpenTelemetry instruments"""
+
+    def __init__(self, client_name: str):
+        self.attributes: Dict[str, str] = {"hyrelog.client": client_name}
+        self.requests = 0
+        self.request_errors = 0
+        self.retries = 0
+        self.rate_limited = 0
+        self.hedged_requests = 0
+        self.deadline_exceeded = 0
+        self.region_failovers = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.events_sent = 0
+        self.events_dropped = 0
+        self.events_quarantined = 0
+        self.events_shed = 0
+        self.events_sampled_out = 0
+        self.request_latency = Histogram(LATENCY_BUCKETS_MS)
+        self.batch_size = Histogram(BATCH_SIZE_BUCKETS)
+        self._queue_probe: Optional[QueueProbe] = None
+
+    @property
+    def instruments(self) -> _Instruments:
+        """Process-wide OpenTelemetry instruments, created on first record"""
+        return _get_instruments()
+
+    def set_queue_probe(self, probe: QueueProbe) -> None:
+        """Register a callable reporting (queue depth, oldest event age in seconds)"""
+        self._queue_probe = probe
+        _queue_probes.add(self)
+
+    def queue_stats(self) -> Tuple[int, Optional[float]]:
+        """Current queue depth and age of the oldest queued event"""
+        if self._queue_probe is None:
+            return 0, None
+        return self._queue_probe()
+
+    def record_request(
+        self,
+        method: str,
+        status_code: Optional[int],
+        duration_ms: float,
+        bytes_sent: int,
+        bytes_received: int,
+    ) -> None:
+        """Record one HTTP attempt"""
+        self.requests += 1
+        self.bytes_sent += bytes_sent
+        self.bytes_received += bytes_received
+        if status_code is None or status_code >= 400:
+            self.request_errors += 1
+        self.request_latency.record(duration_ms)
+
+        attributes = {
+            **self.attributes,
+            "http.method": method,
+            "http.status_code": status_code or 0,
+        }
+        self.instruments.requests.add(1, attributes)
+        self.instruments.request_duration.record(duration_ms, attributes)
+        if bytes_sent:
+            self.instruments.bytes_sent.add(bytes_sent, self.attributes)
+
+    def record_retry(self) -> None:
+        """Record a retried request"""
+        self.retries += 1
+        self.instruments.retries.add(1, self.attributes)
+
+    def record_hedge(self) -> None:
+        """Record a backup request sent for a slow GET"""
+        self.hedged_requests += 1
+        self.instruments.hedged.add(1, self.attributes)
+
+    def record_failover(self, from_region: str, to_region: str) -> None:
+        """Record batch ingestion moving from one region to another"""
+        self.region_failovers += 1
+        self.instruments.region_failovers.add(
+            1,
+            {
+                **self.attributes,
+                "hyrelog.region.from": from_region,
+                "hyrelog.region.to": to_region,
+            },
+        )
+
+    def record_deadline_exceeded(self) -> None:
+        """Record a request abandoned at its deadline"""
+        self.deadline_exceeded += 1
+        self.instruments.deadline_exceeded.add(1, self.attributes)
+
+    def record_rate_limited(self) -> None:
+        """Record a 429 response"""
+        self.rate_limited += 1
+        self.instruments.rate_limited.add(1, self.attributes)
+
+    def record_batch(self, size: int) -> None:
+        """Record a successfully sent batch"""
+        self.events_sent += size
+        self.batch_size.record(size)
+        self.instruments.batch_size.record(size, self.attributes)
+
+    def record_dropped(self, count: int) -> None:
+        """Record events that were dequeued but never delivered"""
+        if count <= 0:
+            return
+        self.events_dropped += count
+        self.instruments.events_dropped.add(count, self.attributes)
+
+    def record_quarantined(self, count: int = 1) -> None:
+        """Record events that failed schema validation"""
+        self.events_quarantined += count
+        self.instruments.events_quarantined.add(count, self.attributes)
+
+    def record_shed(self, count: int, lane: str) -> None:
+        """Record events a lane discarded by sampling or overflow"""
+        if count <= 0:
+            return
+        self.events_shed += count
+        self.instruments.events_shed.add(count, {**self.attributes, "hyrelog.lane": lane})
+
+    def record_sampled_out(self, count: int) -> None:
+        """Record events discarded by deterministic sampling"""
+        if count <= 0:
+            return
+        self.events_sampled_out += count
+        self.instruments.events_sampled_out.add(count, self.attributes)
+
+    def snapshot(self) -> ClientStats:
+        """Return a point-in-time copy of the client's counters"""
+        depth, oldest_age = self.queue_stats()
+        return ClientStats(
+            requests=self.requests,
+            request_errors=self.request_errors,
+            retries=self.retries,
+            rate_limited=self.rate_limited,
+            hedged_requests=self.hedged_requests,
+            deadline_exceeded=self.deadline_exceeded,
+            region_failovers=self.region_failovers,
+            bytes_sent=self.bytes_sent,
+            bytes_received=self.bytes_received,
+            events_sent=self.events_sent,
+            events_dropped=self.events_dropped,
+            events_quarantined=self.events_quarantined,
+            events_shed=self.events_shed,
+            events_sampled_out=self.events_sampled_out,
+            queue_depth=depth,
+            oldest_queued_age=oldest_age,
+            request_latency_ms=self.request_latency.snapshot(),
+            batch_size=self.batch_size.snapshot(),
+            captured_at=time.time(),
+        )
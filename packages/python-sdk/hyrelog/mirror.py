@@ -0,0 +1,303 @@
+"""
+Incremental local mirror of events in SQLite
+
+``LocalMirror.sync()`` pulls only events created since the stored
+checkpoint, verifies hash-chain continuity of what it stored, and
+``LocalMirror.query()`` serves ``QueryOptions`` queries from indexed local
+tables.
+"""
+
+import json
+import sqlite3
+import time
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+from hyrelog.compact import FIELD_NAMES, CompactEvent, _to_event, event_row
+from hyrelog.types import Event, QueryOptions, QueryResponse, SyncResult
+
+if TYPE_CHECKING:
+    from hyrelog.client.base import BaseClient
+
+# Stored as JSON text
+_JSON_COLUMNS = frozenset(("payload", "metadata", "changes"))
+
+# QueryOptions filters that select a subset of a workspace's chain
+_SUBSET_FILTERS = ("action", "category", "actor_id", "actor_email", "project_id", "trace_id")
+
+# QueryOptions field -> column for equality filters
+_EQUALITY_FILTERS = (
+    ("action", "action"),
+    ("category", "category"),
+    ("actor_id", "actor_id"),
+    ("actor_email", "actor_email"),
+    ("workspace_id", "workspace_id"),
+    ("project_id", "project_id"),
+    ("trace_id", "trace_id"),
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    {columns},
+    PRIMARY KEY (id)
+);
+CREATE INDEX IF NOT EXISTS events_created_at ON events (created_at, id);
+CREATE INDEX IF NOT EXISTS events_action ON events (action, created_at);
+CREATE INDEX IF NOT EXISTS events_category ON events (category, created_at);
+CREATE INDEX IF NOT EXISTS events_actor_id ON events (actor_id, created_at);
+CREATE INDEX IF NOT EXISTS events_actor_email ON events (actor_email, created_at);
+CREATE INDEX IF NOT EXISTS events_project ON events (project_id, created_at);
+CREATE INDEX IF NOT EXISTS events_workspace ON events (workspace_id, created_at);
+CREATE INDEX IF NOT EXISTS events_workspace_hash ON events (workspace_id, hash);
+CREATE INDEX IF NOT EXISTS events_trace ON events (trace_id);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    scope TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    event_id TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+""".format(
+    columns=",\n    ".join(
+        f"{name} {'INTEGER' if name == 'archived' else 'TEXT'}" for name in FIELD_NAMES
+    )
+)
+
+
+def _normalise_date(value: str) -> str:
+    """Convert an ISO date/datetime to the API's UTC ``...T..:..:..sssZ`` form"""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    parsed = parsed.astimezone(timezone.utc)
+    return parsed.strftime("%Y-%m-%dT%H:%M:%S.") + f"{parsed.microsecond // 1000:03d}Z"
+
+
+def _to_storage(row: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    return tuple(
+        json.dumps(value, separators=(",", ":"))
+        if name in _JSON_COLUMNS and value is not None
+        else value
+        for name, value in zip(FIELD_NAMES, row)
+    )
+
+
+def _from_storage(row: sqlite3.Row) -> Dict[str, Any]:
+    values = dict(zip(FIELD_NAMES, row))
+    for name in _JSON_COLUMNS:
+        if values[name] is not None:
+            values[name] = json.loads(values[name])
+    values["archived"] = bool(values["archived"])
+    return values
+
+
+class LocalMirror:
+    """
+    Local SQLite copy of a client's events
+
+    Works with either client; each distinct set of sync filters, date range
+    included, keeps its own checkpoint. SQLite calls are synchronous, so ``query()`` is a plain
+    method and ``sync()`` blocks the event loop only while writing a page.
+    """
+
+    def __init__(self, client: "BaseClient", path: str = "hyrelog-mirror.db"):
+        self.client = client
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.executescript(_SCHEMA)
+
+    def _scope(self, options: QueryOptions) -> str:
+        filters = options.model_dump(exclude_none=True, exclude={"page", "limit"})
+        # A range's checkpoint must not stand in for an earlier or later range
+        for name in ("from_date", "to_date"):
+            if name in filters:
+                filters[name] = _normalise_date(filters[name])
+        return json.dumps(
+            {"client": type(self.client).__name__, "base_url": self.client.base_url, **filters},
+            sort_keys=True,
+        )
+
+    def checkpoint(self, options: Optional[QueryOptions] = None) -> Optional[Tuple[str, str]]:
+        """(created_at, event id) of the newest synced event for these filters"""
+        row = self.db.execute(
+            "SELECT created_at, event_id FROM checkpoints WHERE scope = ?",
+            (self._scope(options or QueryOptions()),),
+        ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    async def sync(
+        self, options: Optional[QueryOptions] = None, verify_chain: bool = True
+    ) -> SyncResult:
+        """
+        Pull events created since the last checkpoint
+
+        The window ends at ``options.to_date`` or the sync start time,
+        whichever is earlier, so pages do not shift while paging; events at the checkpoint timestamp are fetched again
+        and ignored. The checkpoint only advances after every page has been
+        stored, so an interrupted sync is simply repeated. Chain continuity
+        is checked per workspace unless the filters select a subset of
+        each workspace's events.
+        """
+        started = time.perf_counter()
+        options = options or QueryOptions()
+        scope = self._scope(options)
+        previous = self.checkpoint(options)
+
+        now = _normalise_date(datetime.now(timezone.utc).isoformat())
+        window: Dict[str, Any] = {
+            "to_date": min(_normalise_date(options.to_date), now) if options.to_date else now
+        }
+        if previous:
+            window["from_date"] = previous[0]
+        elif options.from_date:
+            window["from_date"] = _normalise_date(options.from_date)
+        sync_options = options.model_copy(update={**window, "page": 1})
+
+        columns = ", ".join(FIELD_NAMES)
+        placeholders = ", ".join("?" for _ in FIELD_NAMES)
+        insert = f"INSERT OR IGNORE INTO events ({columns}) VALUES ({placeholders})"
+
+        fetched = 0
+        inserted = 0
+        newest: Optional[Tuple[str, str]] = previous
+        workspaces = set()
+        created_index = FIELD_NAMES.index("created_at")
+        workspace_index = FIELD_NAMES.index("workspace_id")
+        async for page in self.client._iter_pages(sync_options):
+            rows = [event_row(raw) for raw in page.get("data", [])]
+            if not rows:
+                continue
+            before = self.db.total_changes
+            with self.db:
+                self.db.executemany(insert, [_to_storage(row) for row in rows])
+            inserted += self.db.total_changes - before
+            fetched += len(rows)
+            for row in rows:
+                workspaces.add(row[workspace_index])
+                key = (row[created_index], row[0])
+                if newest is None or key > newest:
+                    newest = key
+
+        if newest is not None and newest != previous:
+            with self.db:
+                self.db.execute(
+                    "INSERT INTO checkpoints (scope, created_at, event_id, updated_at) "
+                    "VALUES (?, ?, ?, ?) ON CONFLICT (scope) DO UPDATE SET "
+                    "created_at = excluded.created_at, event_id = excluded.event_id, "
+                    "updated_at = excluded.updated_at",
+                    (scope, newest[0], newest[1], time.time()),
+                )
+
+        chain_breaks: List[str] = []
+        if verify_chain and not any(getattr(options, name) for name in _SUBSET_FILTERS):
+            since = previous[0] if previous else ""
+            for workspace_id in sorted(w for w in workspaces if w):
+                chain_breaks.extend(self._chain_breaks(workspace_id, since))
+
+        return SyncResult(
+            fetched=fetched,
+            inserted=inserted,
+            checkpoint_created_at=newest[0] if newest else None,
+            checkpoint_event_id=newest[1] if newest else None,
+            chain_breaks=chain_breaks,
+            duration_ms=(time.perf_counter() - started) * 1000,
+        )
+
+    def _chain_breaks(self, workspace_id: str, since: str) -> List[str]:
+        """
+        Ids of events since ``since`` whose chain link is missing or forked
+
+        The oldest mirrored event of a workspace is the anchor: its
+        predecessor may be outside the retention window.
+        """
+        missing = self.db.execute(
+            """
+            SELECT e.id FROM events e
+            WHERE e.workspace_id = ? AND e.created_at >= ? AND e.prev_hash IS NOT NULL
+              AND e.id != (
+                SELECT id FROM events WHERE workspace_id = ?
+                ORDER BY created_at, id LIMIT 1
+              )
+              AND NOT EXISTS (
+                SELECT 1 FROM events p
+                WHERE p.workspace_id = e.workspace_id AND p.hash = e.prev_hash
+              )
+            ORDER BY e.created_at, e.id
+            """,
+            (workspace_id, since, workspace_id),
+        ).fetchall()
+        forks = self.db.execute(
+            """
+            SELECT e.id FROM events e
+            JOIN (
+                SELECT prev_hash FROM events
+                WHERE workspace_id = ? AND prev_hash IS NOT NULL
+                GROUP BY prev_hash HAVING COUNT(*) > 1
+            ) f ON f.prev_hash = e.prev_hash
+            WHERE e.workspace_id = ? AND e.created_at >= ?
+            ORDER BY e.created_at, e.id
+            """,
+            (workspace_id, workspace_id, since),
+        ).fetchall()
+        return [row[0] for row in missing] + [row[0] for row in forks]
+
+    def _where(self, options: QueryOptions) -> Tuple[str, List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        for option, column in _EQUALITY_FILTERS:
+            value = getattr(options, option)
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if options.from_date:
+            clauses.append("created_at >= ?")
+            params.append(_normalise_date(options.from_date))
+        if options.to_date:
+            clauses.append("created_at <= ?")
+            params.append(_normalise_date(options.to_date))
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def _rows(self, options: QueryOptions, limit: int, offset: int) -> Iterator[Dict[str, Any]]:
+        where, params = self._where(options)
+        cursor = self.db.execute(
+            f"SELECT {', '.join(FIELD_NAMES)} FROM events{where} "
+            "ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?",
+            (*params, limit, offset),
+        )
+        for row in cursor:
+            yield _from_storage(row)
+
+    def query(self, options: Optional[QueryOptions] = None) -> QueryResponse:
+        """Query the mirror with the same options and response shape as the API"""
+        options = options or QueryOptions()
+        page = options.page or 1
+        limit = options.limit or 20
+        where, params = self._where(options)
+        total = self.db.execute(f"SELECT COUNT(*) FROM events{where}", params).fetchone()[0]
+        data: List[Event] = [
+            _to_event(values) for values in self._rows(options, limit, (page - 1) * limit)
+        ]
+        return QueryResponse(
+            data=data,
+            pagination={
+                "page": page,
+                "limit": limit,
+                "total": total,
+                "totalPages": (total + limit - 1) // limit,
+            },
+        )
+
+    def iter_query(self, options: Optional[QueryOptions] = None) -> Iterator[CompactEvent]:
+        """Every matching local event as ``CompactEvent`` records, newest first"""
+        options = options or QueryOptions()
+        where, params = self._where(options)
+        cursor = self.db.execute(
+            f"SELECT {', '.join(FIELD_NAMES)} FROM events{where} ORDER BY created_at DESC, id DESC",
+            params,
+        )
+        for row in cursor:
+            values = _from_storage(row)
+            yield CompactEvent(*(values[name] for name in FIELD_NAMES))
+
+    def close(self) -> None:
+        """Close the SQLite connection"""
+        self.db.close()
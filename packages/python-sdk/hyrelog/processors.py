@@ -0,0 +1,194 @@
+"""
+Event processor pipeline: redaction, size caps and deterministic sampling
+
+``Pipeline`` compiles ``ProcessorOptions`` once into a list of steps over
+the serialized event dict (API field names), so only configured steps run.
+The workspace client applies it when a batch is sent, not when an event
+is queued, keeping the work off the caller's path.
+"""
+
+import fnmatch
+import hashlib
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from hyrelog.types import ProcessorOptions
+
+# Step: event dict -> processed dict, or None to discard the event
+Step = Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]
+
+# Trie leaf marker for redaction paths
+_LEAF = object()
+
+# Fields whose string values are subject to max_string_length
+_FREE_TEXT_FIELDS = ("payload", "metadata", "changes")
+
+# Distinct (category, action) pairs whose sampling rate is remembered
+SAMPLE_CACHE_SIZE = 4096
+
+
+def _redaction_trie(paths: List[str]) -> Dict[Any, Any]:
+    """
+    Dotted paths as a nested dict; ``*`` matches any key
+
+    Lists are traversed transparently, so ``payload.items.sku`` applies to
+    every element of ``payload.items``.
+    """
+    trie: Dict[Any, Any] = {}
+    for path in paths:
+        node = trie
+        for segment in path.split("."):
+            node = node.setdefault(segment, {})
+        node[_LEAF] = True
+    return trie
+
+
+def _redact(value: Any, trie: Dict[Any, Any], placeholder: str) -> Any:
+    if isinstance(value, list):
+        return [_redact(item, trie, placeholder) for item in value]
+    if not isinstance(value, dict):
+        return value
+    wildcard = trie.get("*")
+    result = {}
+    for key, item in value.items():
+        node = trie.get(key, wildcard)
+        if node is None:
+            result[key] = item
+        elif _LEAF in node:
+            result[key] = placeholder
+        else:
+            result[key] = _redact(item, node, placeholder)
+    return result
+
+
+def _truncate(value: Any, limit: int, suffix: str) -> Any:
+    if isinstance(value, str):
+        return value if len(value) <= limit else value[:limit] + suffix
+    if isinstance(value, dict):
+        return {key: _truncate(item, limit, suffix) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_truncate(item, limit, suffix) for item in value]
+    return value
+
+
+def _lookup(event: Dict[str, Any], path: List[str]) -> Any:
+    value: Any = event
+    for segment in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(segment)
+    return value
+
+
+def sample_fraction(key: str) -> float:
+    """Stable position of a key in [0, 1), identical across processes and hosts"""
+    digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / 2**64
+
+
+class Pipeline:
+    """Compiled event processors"""
+
+    def __init__(self, options: Optional[ProcessorOptions] = None):
+        self.options = options = options or ProcessorOptions()
+        for pattern, rate in options.sample.items():
+            if not 0 <= rate <= 1:
+                raise ValueError(f"Sample rate for {pattern!r} must be between 0 and 1")
+        self.sampled_out = 0
+        self.oversized = 0
+        self.steps: List[Step] = []
+
+        # Sampling runs first so discarded events are not processed further
+        self.sampler: Optional[Step] = None
+        if any(rate < 1 for rate in options.sample.values()):
+            self.sampler = self._sampler(options.sample_by.split("."), options.sample)
+        if options.max_string_length is not None:
+            limit = options.max_string_length
+            suffix = options.truncation_suffix
+
+            def truncate(event: Dict[str, Any]) -> Dict[str, Any]:
+                for field in _FREE_TEXT_FIELDS:
+                    if event.get(field) is not None:
+                        event[field] = _truncate(event[field], limit, suffix)
+                return event
+
+            self.steps.append(truncate)
+        # Redact after truncating so the placeholder itself is never cut
+        if options.redact:
+            trie = _redaction_trie(options.redact)
+            placeholder = options.redaction_text
+            self.steps.append(lambda event: _redact(event, trie, placeholder))
+        if options.max_event_bytes is not None:
+            self.steps.append(self._size_cap(options.max_event_bytes))
+
+    def _sampler(self, path: List[str], rules: Dict[str, float]) -> Step:
+        """
+        Keep-rate lookup per event: the first pattern matching the action or
+        category wins, and an event matching none is always kept
+        """
+        compiled = [
+            (re.compile(fnmatch.translate(pattern)), rate) for pattern, rate in rules.items()
+        ]
+        rates: Dict[Tuple[str, str], float] = {}
+
+        def rate_for(category: str, action: str) -> float:
+            key = (category, action)
+            rate = rates.get(key)
+            if rate is None:
+                rate = next((r for p, r in compiled if p.match(action) or p.match(category)), 1.0)
+                if len(rates) >= SAMPLE_CACHE_SIZE:
+                    rates.clear()
+                rates[key] = rate
+            return rate
+
+        def sample(event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            rate = rate_for(event.get("category", ""), event.get("action", ""))
+            if rate >= 1:
+                return event
+            key = _lookup(event, path)
+            # Events without a sampling key are always kept
+            if key is None or sample_fraction(str(key)) < rate:
+                return event
+            self.sampled_out += 1
+            return None
+
+        return sample
+
+    def _size_cap(self, max_bytes: int) -> Step:
+        def cap(event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            size = len(json.dumps(event, separators=(",", ":")).encode())
+            if size <= max_bytes:
+                return event
+            # Replace the free-form fields with a marker, largest first
+            for field in sorted(
+                (f for f in _FREE_TEXT_FIELDS if event.get(f) is not None),
+                key=lambda f: len(json.dumps(event[f], separators=(",", ":"))),
+                reverse=True,
+            ):
+                if field == "changes":
+                    del event[field]
+                else:
+                    event[field] = {"_truncated": True, "_originalBytes": size}
+                if len(json.dumps(event, separators=(",", ":")).encode()) <= max_bytes:
+                    return event
+            self.oversized += 1
+            return None
+
+        return cap
+
+    @property
+    def active(self) -> bool:
+        """Whether any processor is configured"""
+        return bool(self.steps) or self.sampler is not None
+
+    def __call__(self, event: Dict[str, Any], sample: bool = True) -> Optional[Dict[str, Any]]:
+        """Process one serialized event; None if it was sampled out or too large"""
+        if sample and self.sampler is not None and self.sampler(event) is None:
+            return None
+        for step in self.steps:
+            result = step(event)
+            if result is None:
+                return None
+            event = result
+        return event
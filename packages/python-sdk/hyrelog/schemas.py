@@ -0,0 +1,316 @@
+"""
+Client-side validation against the workspace schema registry
+
+Schemas from ``/v1/key/workspace/schemas`` are compiled once into nested
+closures, so validating an event is a handful of function calls rather
+than a walk over the schema document. An event is validated when its
+``action`` matches a schema's ``eventType``; its ``payload`` is checked
+against the highest active version.
+
+The compiler covers the JSON Schema keywords used for event payloads
+(types, properties, items, enums, bounds, patterns and combinators).
+``$ref``, ``format`` and other annotations are not enforced.
+"""
+
+import asyncio
+import re
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from hyrelog.client.base import logger
+from hyrelog.types import EventInput, EventSchema
+
+if TYPE_CHECKING:
+    from hyrelog.client.base import BaseClient
+
+# Validator: (value, path) -> error messages
+Validator = Callable[[Any, str], List[str]]
+
+SCHEMAS_PATH = "/v1/key/workspace/schemas"
+
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: (isinstance(v, int) and not isinstance(v, bool))
+    or (isinstance(v, float) and v.is_integer()),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+}
+
+
+def _valid(value: Any, path: str) -> List[str]:
+    return []
+
+
+def compile_schema(schema: Any) -> Validator:
+    """Compile a JSON Schema document into a validator function"""
+    if schema is True or schema == {}:
+        return _valid
+    if schema is False:
+        return lambda value, path: [f"{path or '/'}: not allowed"]
+
+    checks: List[Validator] = []
+
+    if "type" in schema:
+        names = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+        tests = [_TYPE_CHECKS[name] for name in names if name in _TYPE_CHECKS]
+        expected = " or ".join(names)
+
+        def check_type(value: Any, path: str) -> List[str]:
+            if any(test(value) for test in tests):
+                return []
+            return [f"{path or '/'}: expected {expected}"]
+
+        checks.append(check_type)
+
+    if "enum" in schema:
+        allowed = schema["enum"]
+        checks.append(
+            lambda value, path: [] if value in allowed else [f"{path or '/'}: not one of {allowed}"]
+        )
+    if "const" in schema:
+        constant = schema["const"]
+
+        def check_const(value: Any, path: str) -> List[str]:
+            return [] if value == constant else [f"{path or '/'}: must be {constant!r}"]
+
+        checks.append(check_const)
+
+    checks.extend(_compile_string(schema))
+    checks.extend(_compile_number(schema))
+    checks.extend(_compile_object(schema))
+    checks.extend(_compile_array(schema))
+    checks.extend(_compile_combinators(schema))
+
+    if len(checks) == 1:
+        return checks[0]
+
+    def validate(value: Any, path: str) -> List[str]:
+        errors: List[str] = []
+        for check in checks:
+            errors.extend(check(value, path))
+        return errors
+
+    return validate
+
+
+def _compile_string(schema: Dict[str, Any]) -> List[Validator]:
+    checks: List[Validator] = []
+    min_length = schema.get("minLength")
+    max_length = schema.get("maxLength")
+    pattern = re.compile(schema["pattern"]) if "pattern" in schema else None
+    if min_length is None and max_length is None and pattern is None:
+        return checks
+
+    def check_string(value: Any, path: str) -> List[str]:
+        if not isinstance(value, str):
+            return []
+        errors = []
+        if min_length is not None and len(value) < min_length:
+            errors.append(f"{path or '/'}: shorter than {min_length}")
+        if max_length is not None and len(value) > max_length:
+            errors.append(f"{path or '/'}: longer than {max_length}")
+        if pattern is not None and not pattern.search(value):
+            errors.append(f"{path or '/'}: does not match {pattern.pattern!r}")
+        return errors
+
+    checks.append(check_string)
+    return checks
+
+
+def _compile_number(schema: Dict[str, Any]) -> List[Validator]:
+    bounds: List[Tuple[str, Callable[[float, float], bool], float]] = []
+    for keyword, test in (
+        ("minimum", lambda v, b: v >= b),
+        ("maximum", lambda v, b: v <= b),
+        ("exclusiveMinimum", lambda v, b: v > b),
+        ("exclusiveMaximum", lambda v, b: v < b),
+    ):
+        # Draft 4 boolean exclusive bounds are not supported
+        if isinstance(schema.get(keyword), (int, float)) and not isinstance(schema[keyword], bool):
+            bounds.append((keyword, test, schema[keyword]))
+    multiple_of = schema.get("multipleOf")
+    if not bounds and multiple_of is None:
+        return []
+
+    def check_number(value: Any, path: str) -> List[str]:
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            return []
+        errors = [
+            f"{path or '/'}: {keyword} {bound}"
+            for keyword, test, bound in bounds
+            if not test(value, bound)
+        ]
+        if multiple_of is not None and (value / multiple_of) % 1:
+            errors.append(f"{path or '/'}: not a multiple of {multiple_of}")
+        return errors
+
+    return [check_number]
+
+
+def _compile_object(schema: Dict[str, Any]) -> List[Validator]:
+    properties = {
+        name: compile_schema(subschema) for name, subschema in schema.get("properties", {}).items()
+    }
+    required = tuple(schema.get("required", ()))
+    additional = schema.get("additionalProperties", True)
+    additional_validator = None if additional is True else compile_schema(additional)
+    min_properties = schema.get("minProperties")
+    max_properties = schema.get("maxProperties")
+    if not (properties or required or additional_validator or min_properties or max_properties):
+        return []
+
+    def check_object(value: Any, path: str) -> List[str]:
+        if not isinstance(value, dict):
+            return []
+        errors = [f"{path}/{name}: required" for name in required if name not in value]
+        for name, item in value.items():
+            validator = properties.get(name, additional_validator)
+            if validator is not None:
+                errors.extend(validator(item, f"{path}/{name}"))
+        if min_properties is not None and len(value) < min_properties:
+            errors.append(f"{path or '/'}: fewer than {min_properties} properties")
+        if max_properties is not None and len(value) > max_properties:
+            errors.append(f"{path or '/'}: more than {max_properties} properties")
+        return errors
+
+    return [check_object]
+
+
+def _compile_array(schema: Dict[str, Any]) -> List[Validator]:
+    items = schema.get("items")
+    item_validator = compile_schema(items) if isinstance(items, (dict, bool)) else None
+    tuple_validators = [compile_schema(item) for item in items] if isinstance(items, list) else []
+    min_items = schema.get("minItems")
+    max_items = schema.get("maxItems")
+    if item_validator is None and not tuple_validators and min_items is None and max_items is None:
+        return []
+
+    def check_array(value: Any, path: str) -> List[str]:
+        if not isinstance(value, list):
+            return []
+        errors = []
+        if item_validator is not None:
+            for index, item in enumerate(value):
+                errors.extend(item_validator(item, f"{path}/{index}"))
+        for index, (validator, item) in enumerate(zip(tuple_validators, value)):
+            errors.extend(validator(item, f"{path}/{index}"))
+        if min_items is not None and len(value) < min_items:
+            errors.append(f"{path or '/'}: fewer than {min_items} items")
+        if max_items is not None and len(value) > max_items:
+            errors.append(f"{path or '/'}: more than {max_items} items")
+        return errors
+
+    return [check_array]
+
+
+def _compile_combinators(schema: Dict[str, Any]) -> List[Validator]:
+    checks: List[Validator] = []
+    if "allOf" in schema:
+        all_of = [compile_schema(s) for s in schema["allOf"]]
+        checks.append(lambda value, path: [error for v in all_of for error in v(value, path)])
+    if "anyOf" in schema:
+        any_of = [compile_schema(s) for s in schema["anyOf"]]
+        checks.append(
+            lambda value, path: []
+            if any(not v(value, path) for v in any_of)
+            else [f"{path or '/'}: matches none of anyOf"]
+        )
+    if "oneOf" in schema:
+        one_of = [compile_schema(s) for s in schema["oneOf"]]
+        checks.append(
+            lambda value, path: []
+            if sum(1 for v in one_of if not v(value, path)) == 1
+            else [f"{path or '/'}: must match exactly one of oneOf"]
+        )
+    if "not" in schema:
+        negated = compile_schema(schema["not"])
+        checks.append(
+            lambda value, path: [f"{path or '/'}: matches not"] if not negated(value, path) else []
+        )
+    return checks
+
+
+class SchemaRegistry:
+    """
+    Cached, compiled copy of a workspace's active event schemas
+
+    The schema list is re-fetched after ``refresh_interval`` seconds;
+    validators are recompiled only for event types whose schema id,
+    version or update time changed.
+    """
+
+    def __init__(self, client: "BaseClient", refresh_interval: float = 300.0):
+        self.client = client
+        self.refresh_interval = refresh_interval
+        self.schemas: Dict[str, EventSchema] = {}
+        self.validators: Dict[str, Validator] = {}
+        self.fetched_at: Optional[float] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @property
+    def stale(self) -> bool:
+        """Whether the cache has never been loaded or has expired"""
+        return (
+            self.fetched_at is None or time.monotonic() - self.fetched_at >= self.refresh_interval
+        )
+
+    async def refresh(self) -> None:
+        """Fetch active schemas and recompile those whose version changed"""
+        try:
+            result = await self.client._request("GET", SCHEMAS_PATH, params={"isActive": "true"})
+        except Exception:
+            # Keep serving the cached validators until the next interval
+            self.fetched_at = time.monotonic()
+            raise
+        latest: Dict[str, EventSchema] = {}
+        for raw in result.get("schemas", []):
+            schema = EventSchema(**raw)
+            current = latest.get(schema.event_type)
+            if current is None or schema.version > current.version:
+                latest[schema.event_type] = schema
+
+        validators: Dict[str, Validator] = {}
+        for event_type, schema in latest.items():
+            cached = self.schemas.get(event_type)
+            if cached is not None and cached.fingerprint == schema.fingerprint:
+                validators[event_type] = self.validators[event_type]
+            else:
+                validators[event_type] = compile_schema(schema.json_schema)
+
+        self.schemas = latest
+        self.validators = validators
+        self.fetched_at = time.monotonic()
+
+    async def ensure_fresh(self) -> None:
+        """Refresh the cache if it is stale"""
+        if self.stale:
+            await self.refresh()
+
+    def refresh_in_background(self) -> None:
+        """Start a refresh task if the cache is stale and none is running"""
+        if not self.stale or (self._refresh_task and not self._refresh_task.done()):
+            return
+
+        async def refresh() -> None:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning(f"HyreLog schema refresh failed: {e}")
+
+        self._refresh_task = asyncio.create_task(refresh())
+
+    def close(self) -> None:
+        """Cancel a pending background refresh"""
+        if self._refresh_task and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        self._refresh_task = None
+
+    def validate(self, event: EventInput) -> List[str]:
+        """Errors for an event's payload, empty if valid or no schema applies"""
+        validator = self.validators.get(event.action)
+        if validator is None:
+            return []
+        return validator(event.payload if event.payload is not None else {}, "")
@@ -0,0 +1,60 @@
+"""
+On-disk spool for events that could not be delivered
+
+Each spill is one NDJSON file written atomically (temporary file, then
+rename), named so that files sort in the order they were written.
+"""
+
+import json
+import os
+import time
+from typing import Any, Dict, Iterable, List, Union
+
+from hyrelog.types import EventInput
+
+SPOOL_SUFFIX = ".ndjson"
+
+
+class Spool:
+    """Directory of NDJSON files holding undelivered events"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def write(self, events: Iterable[Union[EventInput, Dict[str, Any]]]) -> str:
+        """Write events (models or serialized dicts) to a new spool file and return its path"""
+        name = f"{time.time_ns():020d}-{os.getpid()}{SPOOL_SUFFIX}"
+        path = os.path.join(self.directory, name)
+        temporary = f"{path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            for event in events:
+                if isinstance(event, dict):
+                    f.write(json.dumps(event, separators=(",", ":")))
+                else:
+                    f.write(event.model_dump_json(exclude_none=True, by_alias=True))
+                f.write("\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, path)
+        return path
+
+    def files(self) -> List[str]:
+        """Spool files, oldest first"""
+        return sorted(
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.endswith(SPOOL_SUFFIX)
+        )
+
+    def read(self, path: str) -> List[EventInput]:
+        """Events stored in one spool file"""
+        with open(path, encoding="utf-8") as f:
+            return [EventInput(**json.loads(line)) for line in f if line.strip()]
+
+    def remove(self, path: str) -> None:
+        """Delete a spool file once its events are delivered"""
+        os.remove(path)
+
+    def __len__(self) -> int:
+        return len(self.files())
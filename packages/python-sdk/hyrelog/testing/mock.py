@@ -26,7 +26,6 @@ class MockEventStore:
             project_id=event.project_id,
             hash=f"hash-{self.next_id}",
             prev_hash=self.events[-1].hash if self.events else None,
-            trace_id=None,
             created_at=datetime.utcnow().isoformat(),
             archived=False,
             **event.model_dump(exclude_none=True),
@@ -66,6 +65,9 @@ class MockEventStore:
         if options.project_id:
             filtered = [e for e in filtered if e.project_id == options.project_id]
 
+        if options.trace_id:
+            filtered = [e for e in filtered if e.trace_id == options.trace_id]
+
         # Sort by createdAt descending
         filtered.sort(key=lambda e: e.created_at, reverse=True)
 
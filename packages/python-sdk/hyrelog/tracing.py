@@ -0,0 +1,127 @@
+"""
+Span helpers with cached tracers, parent/child context and ingestion sampling
+
+OpenTelemetry is imported on first use, so clients created with
+``tracing="off"`` never load it.
+"""
+
+import random
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Tuple
+
+if TYPE_CHECKING:
+    from opentelemetry import trace
+
+TRACING_MODES = ("full", "sampled", "off")
+
+# Set while inside an operation whose span was sampled out, so that the
+# nested HTTP spans are skipped as well instead of becoming orphan roots
+_suppressed: ContextVar[bool] = ContextVar("hyrelog_tracing_suppressed", default=False)
+
+
+class _NoopSpan:
+    """Stand-in yielded when no span is created"""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        pass
+
+    def add_event(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    def record_exception(self, exception: BaseException, **kwargs: Any) -> None:
+        pass
+
+    def set_status(self, status: Any, description: Optional[str] = None) -> None:
+        pass
+
+    def is_recording(self) -> bool:
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Tracing:
+    """
+    Creates SDK spans according to the configured mode
+
+    - ``full``: every operation gets a span (default)
+    - ``sampled``: ingestion operations are traced for ``sample_rate`` of calls,
+      queries are always traced
+    - ``off``: no spans are created
+    """
+
+    def __init__(self, mode: str = "full", sample_rate: float = 1.0):
+        if mode not in TRACING_MODES:
+            raise ValueError(f"Invalid tracing mode: {mode}")
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("trace_sample_rate must be between 0 and 1")
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self._tracer: Optional["trace.Tracer"] = None
+
+    @property
+    def tracer(self) -> "trace.Tracer":
+        """Tracer for the SDK, looked up once per client"""
+        if self._tracer is None:
+            from opentelemetry import trace
+
+            self._tracer = trace.get_tracer("hyrelog-sdk")
+        return self._tracer
+
+    def _should_trace(self, sampled: bool) -> bool:
+        if self.mode == "off" or _suppressed.get():
+            return False
+        if sampled and self.mode == "sampled":
+            return random.random() < self.sample_rate
+        return True
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        sampled: bool = False,
+        kind: str = "internal",
+    ) -> Iterator[Any]:
+        """
+        Run the block inside a span that is current for nested SDK calls
+
+        ``sampled`` marks ingestion paths that are subject to ``sample_rate``;
+        ``kind`` is a SpanKind name such as ``"client"``. When no span is
+        created a no-op span is yielded, so callers can set attributes
+        unconditionally.
+        """
+        if not self._should_trace(sampled):
+            token = _suppressed.set(True) if self.mode != "off" else None
+            try:
+                yield NOOP_SPAN
+            finally:
+                if token is not None:
+                    _suppressed.reset(token)
+            return
+
+        from opentelemetry import trace
+
+        with self.tracer.start_as_current_span(
+            name, kind=trace.SpanKind[kind.upper()], attributes=attributes
+        ) as span:
+            yield span
+            span.set_status(trace.Status(trace.StatusCode.OK))
+
+
+def current_trace_context() -> Optional[Tuple[str, str]]:
+    """Hex trace and span ids of the active span, or None when no span is active"""
+    # Nothing can have started a span if OpenTelemetry was never imported
+    trace = sys.modules.get("opentelemetry.trace")
+    if trace is None:
+        return None
+    context = trace.get_current_span().get_span_context()
+    if not context.is_valid:
+        return None
+    return format(context.trace_id, "032x"), format(context.span_id, "016x")
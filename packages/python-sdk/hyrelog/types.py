@@ -3,7 +3,7 @@ Type definitions for HyreLog SDK
 """
 
 from typing import Optional, Dict, Any, List, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Actor(BaseModel):
@@ -32,6 +32,8 @@ class Change(BaseModel):
 class EventInput(BaseModel):
     """Event input structure"""
 
+    model_config = ConfigDict(populate_by_name=True)
+
     action: str = Field(..., description="Action identifier (e.g., 'user.created')")
     category: str = Field(..., description="Category (e.g., 'auth', 'billing')")
     actor: Optional[Actor] = None
@@ -40,6 +42,8 @@ class EventInput(BaseModel):
     metadata: Optional[Dict[str, Any]] = None
     changes: Optional[List[Change]] = None
     project_id: Optional[str] = Field(None, alias="projectId")
+    trace_id: Optional[str] = Field(None, alias="traceId")
+    span_id: Optional[str] = Field(None, alias="spanId")
 
 
 class Event(EventInput):
@@ -60,6 +64,8 @@ class Event(EventInput):
 class Pagination(BaseModel):
     """Pagination information"""
 
+    model_config = ConfigDict(populate_by_name=True)
+
     page: int
     limit: int
     total: int
@@ -69,15 +75,36 @@ class Pagination(BaseModel):
 class QueryResponse(BaseModel):
     """Query response structure"""
 
+    model_config = ConfigDict(populate_by_name=True)
+
     data: List[Event]
     pagination: Pagination
     retention_applied: Optional[bool] = Field(None, alias="retentionApplied")
     retention_window_start: Optional[str] = Field(None, alias="retentionWindowStart")
 
 
+class RegionQueryStatus(BaseModel):
+    """Outcome of one region's part of a fan-out query"""
+
+    region: str
+    ok: bool
+    error: Optional[str] = None
+    latency_ms: Optional[float] = None
+    total: Optional[int] = None
+
+
+class GlobalQueryResponse(QueryResponse):
+    """Merged result of a fan-out query across regions"""
+
+    partial: bool = False
+    regions: List[RegionQueryStatus] = []
+
+
 class QueryOptions(BaseModel):
     """Query options for event retrieval"""
 
+    model_config = ConfigDict(populate_by_name=True)
+
     page: Optional[int] = 1
     limit: Optional[int] = 20
     from_date: Optional[str] = Field(None, alias="from")
@@ -88,6 +115,7 @@ class QueryOptions(BaseModel):
     actor_email: Optional[str] = Field(None, alias="actorEmail")
     workspace_id: Optional[str] = Field(None, alias="workspaceId")
     project_id: Optional[str] = Field(None, alias="projectId")
+    trace_id: Optional[str] = Field(None, alias="traceId")
 
 
 class RetryConfig(BaseModel):
@@ -108,13 +136,181 @@ class BatchOptions(BaseModel):
     auto_flush: bool = False
 
 
+class LaneConfig(BaseModel):
+    """Batching lane for events matching category/action patterns"""
+
+    name: str
+    categories: List[str] = []
+    actions: List[str] = []
+    max_size: int = 100
+    max_wait: float = 5.0
+    capacity: Optional[int] = None
+    overflow: Literal["keep", "shed", "drop_oldest"] = "keep"
+    sample_rate: float = 1.0
+
+
+class ProcessorOptions(BaseModel):
+    """Redaction, size caps and per-action sampling applied to events before sending"""
+
+    redact: List[str] = []
+    redaction_text: str = "[REDACTED]"
+    max_string_length: Optional[int] = None
+    truncation_suffix: str = "...[truncated]"
+    max_event_bytes: Optional[int] = None
+    # Keep rate per action or category pattern (fnmatch syntax); events that
+    # match no pattern are never sampled
+    sample: Dict[str, float] = {}
+    sample_by: str = "traceId"
+
+
 class HyreLogClientOptions(BaseModel):
     """Client configuration options"""
 
+    model_config = ConfigDict(populate_by_name=True)
+
     api_key: str = Field(..., alias="apiKey")
     base_url: str = Field("https://api.hyrelog.com", alias="baseUrl")
     debug: bool = False
     timeout: float = 30.0
     retry_config: Optional[RetryConfig] = None
     batch_config: Optional[BatchOptions] = None
+    tracing: Literal["full", "sampled", "off"] = "full"
+    trace_sample_rate: float = 1.0
+    capture_trace_context: bool = True
+    validate_schemas: Literal["off", "enqueue", "background"] = "off"
+    schema_refresh_interval: float = 300.0
+    spool_dir: Optional[str] = None
+    shutdown_timeout: float = 5.0
+    collector_socket: Optional[str] = None
+    lanes: List[LaneConfig] = []
+    processors: Optional[ProcessorOptions] = None
+    hedging: bool = False
+    hedge_delay: Optional[float] = None
+    hedge_min_samples: int = 20
+    region_endpoints: Optional[Dict[str, str]] = None
+    data_regions: Optional[List[str]] = None
+    region_info: Optional[Dict[str, Any]] = None
+    region_probe_interval: float = 30.0
+    region_cooldown: float = 30.0
+
+
+class HistogramSnapshot(BaseModel):
+    """Histogram snapshot"""
+
+    count: int
+    sum: float
+    min: Optional[float] = None
+    max: Optional[float] = None
+    buckets: Dict[str, int]
+
+
+class ClientStats(BaseModel):
+    """Point-in-time client statistics returned by ``client.stats()``"""
+
+    requests: int
+    request_errors: int
+    retries: int
+    rate_limited: int
+    hedged_requests: int = 0
+    deadline_exceeded: int = 0
+    region_failovers: int = 0
+    bytes_sent: int
+    bytes_received: int
+    events_sent: int
+    events_dropped: int
+    events_quarantined: int = 0
+    events_shed: int = 0
+    events_sampled_out: int = 0
+    queue_depth: int
+    oldest_queued_age: Optional[float] = None
+    request_latency_ms: HistogramSnapshot
+    batch_size: HistogramSnapshot
+    captured_at: float
+
+
+class SyncResult(BaseModel):
+    """Outcome of a ``LocalMirror.sync()`` run"""
+
+    fetched: int
+    inserted: int
+    checkpoint_created_at: Optional[str] = None
+    checkpoint_event_id: Optional[str] = None
+    chain_breaks: List[str] = []
+    duration_ms: float
+
+
+class ImportResult(BaseModel):
+    """Outcome of a bulk import run"""
+
+    events_sent: int
+    events_invalid: int
+    events_rejected: int
+    events_skipped: int
+    batches: int
+    bytes_read: int
+    duration_ms: float
+    events_per_second: float
+    complete: bool
+
+
+class RegionHealth(BaseModel):
+    """Routing view of one regional ingestion endpoint"""
+
+    region: str
+    base_url: str
+    latency_ms: Optional[float] = None
+    error_rate: float = 0.0
+    healthy: bool = True
+    active: bool = False
+    samples: int = 0
+
+
+class EventSchema(BaseModel):
+    """Event schema from the workspace schema registry"""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: str
+    event_type: str = Field(..., alias="eventType")
+    description: Optional[str] = None
+    json_schema: Dict[str, Any] = Field(..., alias="jsonSchema")
+    version: int = 1
+    is_active: bool = Field(True, alias="isActive")
+    updated_at: Optional[str] = Field(None, alias="updatedAt")
+
+    @property
+    def fingerprint(self) -> str:
+        """Changes whenever the schema is replaced or edited"""
+        return f"{self.id}:{self.version}:{self.updated_at}"
 
+
+class QuarantinedEvent(BaseModel):
+    """Event held back because it failed schema validation"""
+
+    event: EventInput
+    errors: List[str]
+    schema_version: Optional[int] = None
+    quarantined_at: float
+
+
+class Job(BaseModel):
+    """Asynchronous server-side job, e.g. a GDPR export"""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: str
+    company_id: Optional[str] = Field(None, alias="companyId")
+    type: Optional[str] = None
+    status: Literal["PENDING", "PROCESSING", "COMPLETED", "FAILED"]
+    params: Optional[Dict[str, Any]] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    started_at: Optional[str] = Field(None, alias="startedAt")
+    completed_at: Optional[str] = Field(None, alias="completedAt")
+    created_at: Optional[str] = Field(None, alias="createdAt")
+    updated_at: Optional[str] = Field(None, alias="updatedAt")
+
+    @property
+    def done(self) -> bool:
+        """Whether the job has finished, successfully or not"""
+        return self.status in ("COMPLETED", "FAILED")
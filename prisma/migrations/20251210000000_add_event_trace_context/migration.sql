@@ -0,0 +1,8 @@
+-- AlterTable
+ALTER TABLE "AuditEvent" ADD COLUMN     "spanId" TEXT;
+
+-- CreateIndex
+CREATE INDEX "AuditEvent_workspaceId_traceId_idx" ON "AuditEvent"("workspaceId", "traceId");
+
+-- CreateIndex
+CREATE INDEX "AuditEvent_companyId_traceId_idx" ON "AuditEvent"("companyId", "traceId");
@@ -64,6 +64,7 @@ export async function processPendingWrites(region: Region): Promise<number> {
                     hash: eventData.hash,
                     prevHash: eventData.prevHash ?? null,
                     traceId: eventData.traceId ?? null,
+                    spanId: eventData.spanId ?? null,
                     dataRegion: eventData.dataRegion,
                     createdAt: eventData.createdAt
                 }
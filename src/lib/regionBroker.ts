@@ -76,6 +76,7 @@ export async function ingestEventToRegion(
                     hash: eventData.hash,
                     prevHash: eventData.prevHash,
                     traceId: eventData.traceId ?? null,
+                    spanId: eventData.spanId ?? null,
                     dataRegion: region as DataRegion,
                     createdAt:
                         (eventData as typeof eventData & { createdAt?: Date })
@@ -137,6 +138,7 @@ export async function queryWorkspaceEvents(
         actorId?: string;
         actorEmail?: string;
         projectId?: string;
+        traceId?: string;
         from?: Date;
         to?: Date;
     }
@@ -175,6 +177,9 @@ export async function queryWorkspaceEvents(
     if (filters.projectId) {
         where.projectId = filters.projectId;
     }
+    if (filters.traceId) {
+        where.traceId = filters.traceId;
+    }
     if (filters.from || filters.to) {
         where.createdAt = {};
         if (filters.from) {
@@ -216,6 +221,7 @@ export async function queryCompanyEvents(
         actorEmail?: string;
         workspaceId?: string;
         projectId?: string;
+        traceId?: string;
         from?: Date;
         to?: Date;
     }
@@ -247,6 +253,9 @@ export async function queryCompanyEvents(
     if (filters.projectId) {
         where.projectId = filters.projectId;
     }
+    if (filters.traceId) {
+        where.traceId = filters.traceId;
+    }
     if (filters.from || filters.to) {
         where.createdAt = {};
         if (filters.from) {
@@ -119,6 +119,11 @@ export const buildOpenApiDocument = () => ({
                         in: 'query',
                         schema: { type: 'string' }
                     },
+                    {
+                        name: 'traceId',
+                        in: 'query',
+                        schema: { type: 'string' }
+                    },
                     {
                         name: 'page',
                         in: 'query',
@@ -241,6 +246,11 @@ export const buildOpenApiDocument = () => ({
                         in: 'query',
                         schema: { type: 'string' }
                     },
+                    {
+                        name: 'traceId',
+                        in: 'query',
+                        schema: { type: 'string' }
+                    },
                     {
                         name: 'page',
                         in: 'query',
@@ -58,6 +58,9 @@ export const keyCompanyEventsRoutes: FastifyPluginAsync = async (app) => {
                 : {}),
             ...(filters.projectId
                 ? { projectId: { equals: filters.projectId } }
+                : {}),
+            ...(filters.traceId
+                ? { traceId: { equals: filters.traceId } }
                 : {})
         };
 
@@ -71,6 +74,7 @@ export const keyCompanyEventsRoutes: FastifyPluginAsync = async (app) => {
             ...(filters.actorEmail && { actorEmail: filters.actorEmail }),
             ...(filters.workspaceId && { workspaceId: filters.workspaceId }),
             ...(filters.projectId && { projectId: filters.projectId }),
+            ...(filters.traceId && { traceId: filters.traceId }),
             ...(createdAtFilter.gte && { from: createdAtFilter.gte as Date }),
             ...(createdAtFilter.lte && { to: createdAtFilter.lte as Date })
         });
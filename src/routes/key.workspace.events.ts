@@ -71,6 +71,9 @@ export const keyWorkspaceEventsRoutes: FastifyPluginAsync = async (app) => {
                 : {}),
             ...(filters.actorEmail
                 ? { actorEmail: { equals: filters.actorEmail } }
+                : {}),
+            ...(filters.traceId
+                ? { traceId: { equals: filters.traceId } }
                 : {})
         };
 
@@ -83,6 +86,7 @@ export const keyWorkspaceEventsRoutes: FastifyPluginAsync = async (app) => {
             actorId?: string;
             actorEmail?: string;
             projectId?: string;
+            traceId?: string;
             from?: Date;
             to?: Date;
         } = {
@@ -106,6 +110,9 @@ export const keyWorkspaceEventsRoutes: FastifyPluginAsync = async (app) => {
         if (filters.projectId) {
             queryFilters.projectId = filters.projectId;
         }
+        if (filters.traceId) {
+            queryFilters.traceId = filters.traceId;
+        }
         if (filters.to) {
             queryFilters.to = filters.to;
         }
@@ -247,7 +254,8 @@ export const keyWorkspaceEventsRoutes: FastifyPluginAsync = async (app) => {
             prevHash
         );
 
-        const traceId = getTraceId() ?? undefined;
+        // Prefer the caller's trace context, sent by the SDKs
+        const traceId = payload.traceId ?? getTraceId() ?? undefined;
 
         // Use region broker for ingestion
         const event = await ingestEventToRegion(ctx.company.id, workspace.id, {
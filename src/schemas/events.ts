@@ -33,7 +33,19 @@ export const ingestEventSchema = z.object({
      * Changes array for tracking field updates (e.g., user.name: old="John", new="Jane").
      * Each change represents a field that was modified.
      */
-    changes: z.array(changeSchema).optional()
+    changes: z.array(changeSchema).optional(),
+    /**
+     * W3C trace context of the operation that produced the event, captured
+     * by the SDKs so audit events can be looked up from a trace.
+     */
+    traceId: z
+        .string()
+        .regex(/^[0-9a-f]{32}$/)
+        .optional(),
+    spanId: z
+        .string()
+        .regex(/^[0-9a-f]{16}$/)
+        .optional()
 });
 
 export type IngestEventInput = z.infer<typeof ingestEventSchema>;
@@ -60,7 +72,8 @@ export const eventFilterSchema = z.object({
     actorId: z.string().optional(),
     actorEmail: z.string().optional(),
     workspaceId: z.string().optional(),
-    projectId: z.string().optional()
+    projectId: z.string().optional(),
+    traceId: z.string().optional()
 });
 
 export type EventFilterInput = z.infer<typeof eventFilterSchema>;
@@ -129,6 +129,7 @@ async function replicateCompanyEvents(
                         hash,
                         prevHash,
                         traceId: event.traceId ?? null,
+                        spanId: event.spanId ?? null,
                         dataRegion: replicaRegion as DataRegion, // Region enum matches DataRegion enum
                         archived: event.archived,
                         archivalCandidate: event.archivalCandidate,